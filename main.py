@@ -1,4 +1,6 @@
 # flake8: noqa
+import logging
+
 from fastapi import FastAPI, status
 
 # Import future routers here...
@@ -69,6 +71,14 @@ from routers import (
     xml_formatter_router,
 )
 
+# Configure logging once for the whole app; routers only create module-level loggers.
+# force=True replaces any handler an imported module installed on the root logger first.
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    force=True,
+)
+
 app = FastAPI(
     title="IT Tools API (Python)",
     description="Standalone API replicating IT Tools functionality.",
@@ -18,8 +18,6 @@ from phonenumbers import (
 
 from mcp_server import mcp_app
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
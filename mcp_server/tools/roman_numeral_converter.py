@@ -8,29 +8,19 @@ from typing import Any
 
 from mcp_server import mcp_app
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Roman numeral mapping (descending order for easy conversion)
-ROMAN_MAP = [
-    (1000, "M"),
-    (900, "CM"),
-    (500, "D"),
-    (400, "CD"),
-    (100, "C"),
-    (90, "XC"),
-    (50, "L"),
-    (40, "XL"),
-    (10, "X"),
-    (9, "IX"),
-    (5, "V"),
-    (4, "IV"),
-    (1, "I"),
-]
-
-# Reverse mapping for decoding
-DECIMAL_MAP = {v: k for k, v in ROMAN_MAP}
+# Per-symbol values for single-pass decoding
+_SYMBOL_VALUES = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
+
+# Precomputed numerals per decimal digit, indexed by digit value
+_THOUSANDS = ("", "M", "MM", "MMM")
+_HUNDREDS = ("", "C", "CC", "CCC", "CD", "D", "DC", "DCC", "DCCC", "CM")
+_TENS = ("", "X", "XX", "XXX", "XL", "L", "LX", "LXX", "LXXX", "XC")
+_ONES = ("", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX")
+
+# Canonical (standard form) Roman numerals for 1-3999
+_STANDARD_ROMAN_RE = re.compile(r"^M{0,3}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})$")
 
 
 @mcp_app.tool()
@@ -52,12 +42,9 @@ def encode_to_roman(number: int) -> dict[str, Any]:
         if not 1 <= number <= 3999:
             return {"input_value": number, "result": "", "error": "Number must be between 1 and 3999"}
 
-        result = ""
-        num = number
-        for value, numeral in ROMAN_MAP:
-            while num >= value:
-                result += numeral
-                num -= value
+        result = (
+            _THOUSANDS[number // 1000] + _HUNDREDS[number // 100 % 10] + _TENS[number // 10 % 10] + _ONES[number % 10]
+        )
 
         return {"input_value": number, "result": result, "error": None}
 
@@ -81,52 +68,35 @@ def decode_from_roman(roman_numeral: str) -> dict[str, Any]:
             error: Optional error message
     """
     try:
-        # Validate basic format (only valid characters)
         roman_numeral = roman_numeral.upper()
-        if not re.match(r"^[MDCLXVI]+$", roman_numeral):
+        invalid_characters = {
+            "input_value": roman_numeral,
+            "result": 0,
+            "error": "Invalid characters in Roman numeral. Only M, D, C, L, X, V, I are allowed.",
+        }
+        if not roman_numeral:
+            return invalid_characters
+
+        # Single pass from the right: a symbol smaller than the one after it is subtracted (e.g., IX, CM)
+        result = 0
+        previous = 0
+        try:
+            for symbol in reversed(roman_numeral):
+                value = _SYMBOL_VALUES[symbol]
+                result += value if value >= previous else -value
+                previous = value
+        except KeyError:
+            return invalid_characters
+
+        # Check for validity against the canonical pattern. This catches non-standard forms.
+        if 1 <= result <= 3999 and not _STANDARD_ROMAN_RE.match(roman_numeral):
+            # Non-standard form warning
             return {
                 "input_value": roman_numeral,
-                "result": 0,
-                "error": "Invalid characters in Roman numeral. Only M, D, C, L, X, V, I are allowed.",
+                "result": result,
+                "error": "Warning: Roman numeral is not in standard form.",
             }
 
-        result = 0
-        i = 0
-        while i < len(roman_numeral):
-            # Check for two-character subtractive combinations (e.g., CM, IX)
-            if i + 1 < len(roman_numeral) and roman_numeral[i : i + 2] in DECIMAL_MAP:
-                result += DECIMAL_MAP[roman_numeral[i : i + 2]]
-                i += 2
-            # Otherwise, process single character
-            elif roman_numeral[i] in DECIMAL_MAP:
-                result += DECIMAL_MAP[roman_numeral[i]]
-                i += 1
-            else:
-                # Should not happen given the regex check, but for safety
-                return {
-                    "input_value": roman_numeral,
-                    "result": 0,
-                    "error": f"Invalid Roman numeral symbol encountered: {roman_numeral[i]}",
-                }
-
-        # Check for validity by re-encoding. This catches non-standard forms.
-        re_encoded_error = None
-        try:
-            if 1 <= result <= 3999:  # Only re-validate if within standard range
-                re_encoded_dict = encode_to_roman(result)
-                re_encoded_error = re_encoded_dict.get("error")
-                if re_encoded_error or re_encoded_dict.get("result") != roman_numeral:
-                    # Non-standard form warning
-                    return {
-                        "input_value": roman_numeral,
-                        "result": result,
-                        "error": "Warning: Roman numeral is not in standard form.",
-                    }
-        except Exception as re_enc_e:
-            # Tolerate re-encoding check failures but log them
-            logger.warning(f"Re-encoding check failed for {roman_numeral} -> {result}: {re_enc_e}")
-            re_encoded_error = f"Re-encoding check failed: {re_enc_e}"
-
         # Final check: Ensure decoded result is within standard range (1-3999)
         if not 1 <= result <= 3999:
             return {
@@ -2,10 +2,52 @@
 UUID generator tool for MCP server.
 """
 
+import functools
+import os
 import uuid
 
 from mcp_server import mcp_app
 
+# Variant name mapping
+_VARIANT_NAMES = {
+    uuid.RFC_4122: "RFC 4122",
+    uuid.RESERVED_NCS: "NCS (Reserved)",
+    uuid.RESERVED_MICROSOFT: "Microsoft (Reserved)",
+    uuid.RESERVED_FUTURE: "Future (Reserved)",
+}
+_NIL_UUID = uuid.UUID(int=0)
+
+
+@functools.lru_cache(maxsize=256)
+def _namespace_uuid(namespace: str) -> uuid.UUID:
+    """Parse a namespace UUID string; v3/v5 callers reuse a handful of namespaces (DNS, URL, ...)."""
+    return uuid.UUID(namespace)
+
+
+def _random_uuid_details() -> dict:
+    """Version 4 details computed straight from 16 random bytes, without building a uuid.UUID.
+
+    Same bits as uuid.uuid4(): random bytes with the version nibble set to 4 and the RFC 4122 variant.
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+
+    hex_str = raw.hex()
+    integer = int.from_bytes(raw, "big")
+    uuid_str = f"{hex_str[:8]}-{hex_str[8:12]}-{hex_str[12:16]}-{hex_str[16:20]}-{hex_str[20:]}"
+    return {
+        "uuid": uuid_str,
+        "version": 4,
+        "variant": _VARIANT_NAMES[uuid.RFC_4122],
+        "is_nil": False,  # The version and variant bits are never all zero
+        "hex": hex_str,
+        "bytes": hex_str,
+        "urn": f"urn:uuid:{uuid_str}",
+        "integer": integer,
+        "binary": format(integer, "0128b"),
+    }
+
 
 @mcp_app.tool()
 def generate_uuid(version: int = 4, namespace: str | None = None, name: str | None = None) -> dict:
@@ -42,19 +84,19 @@ def generate_uuid(version: int = 4, namespace: str | None = None, name: str | No
         if not namespace or not name:
             raise ValueError("For UUID version 3, both namespace and name must be provided")
         try:
-            namespace_uuid = uuid.UUID(namespace)
+            namespace_uuid = _namespace_uuid(namespace)
         except ValueError:
             raise ValueError(f"Invalid namespace UUID: {namespace}")
         uuid_obj = uuid.uuid3(namespace_uuid, name)
     elif version == 4:
-        # Random UUID
-        uuid_obj = uuid.uuid4()
+        # Random UUID; every field is derived from the raw bytes in one pass
+        return _random_uuid_details()
     elif version == 5:
         # Name-based UUID with SHA-1
         if not namespace or not name:
             raise ValueError("For UUID version 5, both namespace and name must be provided")
         try:
-            namespace_uuid = uuid.UUID(namespace)
+            namespace_uuid = _namespace_uuid(namespace)
         except ValueError:
             raise ValueError(f"Invalid namespace UUID: {namespace}")
         uuid_obj = uuid.uuid5(namespace_uuid, name)
@@ -62,14 +104,6 @@ def generate_uuid(version: int = 4, namespace: str | None = None, name: str | No
     # Assert version is not None (should be guaranteed for v1/v4)
     assert uuid_obj.version is not None, "Generated UUID has no version"
 
-    # Variant name mapping
-    variant_names = {
-        uuid.RFC_4122: "RFC 4122",
-        uuid.RESERVED_NCS: "NCS (Reserved)",
-        uuid.RESERVED_MICROSOFT: "Microsoft (Reserved)",
-        uuid.RESERVED_FUTURE: "Future (Reserved)",
-    }
-
     # Format as binary string (128 bits)
     binary = format(int(uuid_obj), "0128b")
 
@@ -77,8 +111,8 @@ def generate_uuid(version: int = 4, namespace: str | None = None, name: str | No
     return {
         "uuid": str(uuid_obj),
         "version": uuid_obj.version,
-        "variant": variant_names.get(uuid_obj.variant, "Unknown"),
-        "is_nil": uuid_obj == uuid.UUID(int=0),
+        "variant": _VARIANT_NAMES.get(uuid_obj.variant, "Unknown"),
+        "is_nil": uuid_obj == _NIL_UUID,
         "hex": uuid_obj.hex,
         "bytes": uuid_obj.bytes.hex(),
         "urn": uuid_obj.urn,
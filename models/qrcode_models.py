@@ -14,6 +14,7 @@ class QrErrorCorrectLevel(str, Enum):
 class QrOutputFormat(str, Enum):
     svg = "svg"
     png = "png"  # Will be Base64 encoded
+    png_binary = "png_binary"  # Raw PNG bytes (image/png response)
     # terminal = "terminal" # Could add terminal output
 
 
@@ -22,7 +23,9 @@ class QrCodeInput(BaseModel):
     error_correction: QrErrorCorrectLevel = Field(
         QrErrorCorrectLevel.M, description="Error correction level (L, M, Q, H)"
     )
-    output_format: QrOutputFormat = Field(QrOutputFormat.svg, description="Desired output format (svg, png)")
+    output_format: QrOutputFormat = Field(
+        QrOutputFormat.svg, description="Desired output format (svg, png, png_binary)"
+    )
     # box_size: int = Field(10, description="Size of each box in pixels (for PNG)")
     # border: int = Field(4, description="Thickness of the border in boxes")
     # Add styling options if needed: fill_color, back_color
@@ -49,4 +52,6 @@ class WifiQrCodeInput(BaseModel):
         QrErrorCorrectLevel.M,
         description="QR code error correction level (L, M, Q, H).",
     )
-    output_format: QrOutputFormat = Field(QrOutputFormat.svg, description="Desired output format (svg, png).")
+    output_format: QrOutputFormat = Field(
+        QrOutputFormat.svg, description="Desired output format (svg, png, png_binary)."
+    )
@@ -1,14 +1,25 @@
+from enum import Enum
 from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
 
+class RegexEngine(str, Enum):
+    re = "re"  # Python's backtracking engine (always available)
+    re2 = "re2"  # Linear-time RE2 engine (requires the optional google-re2 package)
+
+
 class RegexInput(BaseModel):
     regex_pattern: str = Field(..., description="Regular expression pattern")
     test_string: str = Field("", description="String to test the regex against")
     ignore_case: bool = Field(False, description="Perform case-insensitive matching")
     multiline: bool = Field(False, description="Make ^ and $ match start/end of lines")
     dot_all: bool = Field(False, description="Make . match newline characters")
+    engine: RegexEngine = Field(
+        RegexEngine.re,
+        description="Regex engine to use. re2 guarantees linear-time matching; patterns it cannot handle "
+        "(e.g. backreferences, lookarounds) or a missing google-re2 install fall back to re.",
+    )
     # global_match: bool = Field(True, description="Find all matches (currently always true)")
 
 
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import Annotated, List
+
+from pydantic import BaseModel, Field
 
 
 class SlugifyInput(BaseModel):
@@ -7,3 +9,13 @@ class SlugifyInput(BaseModel):
 
 class SlugifyOutput(BaseModel):
     slug: str
+
+
+class SlugifyBatchInput(BaseModel):
+    texts: List[Annotated[str, Field(max_length=100_000)]] = Field(
+        ..., max_length=1000, description="Strings to slugify (max 1000, each at most 100,000 characters)"
+    )
+
+
+class SlugifyBatchOutput(BaseModel):
+    slugs: List[str]
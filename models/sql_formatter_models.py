@@ -6,7 +6,7 @@ KeywordCase = Literal["upper", "lower", "capitalize"]
 
 
 class SqlFormatInput(BaseModel):
-    sql_string: str
+    sql_string: str = Field(..., max_length=200_000, description="SQL to format (max 200,000 characters)")
     keyword_case: KeywordCase = Field("upper", description="Case for keywords (upper, lower, capitalize)")
     indent_width: int = Field(2, gt=0, description="Number of spaces for indentation")
     reindent: bool = Field(True, description="Re-indent statements")
@@ -1,7 +1,11 @@
+import re
 from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+# #rgb or #rrggbb; the colors are written into SVG attributes, so nothing else is allowed through
+HEX_COLOR_REGEX = re.compile(r"#(?:[0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})")
+
 
 class SvgInput(BaseModel):
     width: int = Field(..., description="Width of the SVG placeholder", ge=1)
@@ -11,17 +15,17 @@ class SvgInput(BaseModel):
     text_color: str = Field("#969696", description="Text color (hex)")
     font_family: str = Field("sans-serif", description="Font family for text")
     font_size: Optional[int] = Field(None, description="Font size (auto-calculated if not provided)", ge=1)
+    include_data_uri: bool = Field(True, description="Also return the SVG as a Base64 data URI")
 
     @field_validator("bg_color", "text_color")
     @classmethod
     def validate_hex_color(cls, v):
-        if not v.startswith("#") or len(v) not in [4, 7]:
+        if not HEX_COLOR_REGEX.fullmatch(v):
             raise ValueError("Invalid hex color format (e.g., #ccc or #cccccc)")
-        # Add more validation if needed (e.g., check hex chars)
         return v
 
 
 class SvgOutput(BaseModel):
     svg: str = Field(..., description="Generated SVG placeholder code")
-    data_uri: str = Field(..., description="Data URI for the SVG")
+    data_uri: str = Field(..., description="Data URI for the SVG (empty when include_data_uri is false)")
     error: Optional[str] = None
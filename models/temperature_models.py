@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -20,3 +20,11 @@ class TemperatureOutput(BaseModel):
     fahrenheit: float
     kelvin: float
     error: Optional[str] = None
+
+
+class TemperatureBatchInput(BaseModel):
+    items: List[TemperatureInput] = Field(..., max_length=1000, description="Values to convert (max 1000)")
+
+
+class TemperatureBatchOutput(BaseModel):
+    results: List[TemperatureOutput]
@@ -1,10 +1,14 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
 
 class TextBinaryInput(BaseModel):
-    text: str = Field(..., description="Text to convert to binary or binary to decode")
+    text: str = Field(
+        ...,
+        max_length=1_000_000,
+        description="Text to convert to binary or binary to decode (max 1,000,000 characters)",
+    )
     mode: str = Field(..., description="Conversion mode: text_to_binary or binary_to_text")
     include_spaces: bool = Field(True, description="Include spaces between binary values")
     space_replacement: str = Field("00100000", description="Binary representation to use for spaces")
@@ -15,3 +19,11 @@ class TextBinaryOutput(BaseModel):
     result: str = Field(..., description="Conversion result")
     mode: str = Field(..., description="Mode used for conversion")
     char_mapping: Optional[Dict[str, str]] = None
+
+
+class TextBinaryBatchInput(BaseModel):
+    items: List[TextBinaryInput] = Field(..., max_length=1000, description="Conversions to run (max 1000)")
+
+
+class TextBinaryBatchOutput(BaseModel):
+    results: List[TextBinaryOutput]
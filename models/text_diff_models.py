@@ -12,8 +12,8 @@ class DiffFormat(str, Enum):
 
 
 class TextDiffInput(BaseModel):
-    text1: str = Field(..., description="First text to compare")
-    text2: str = Field(..., description="Second text to compare")
+    text1: str = Field(..., max_length=1_000_000, description="First text to compare (max 1,000,000 characters)")
+    text2: str = Field(..., max_length=1_000_000, description="Second text to compare (max 1,000,000 characters)")
     output_format: DiffFormat = Field(DiffFormat.HTML, description="Output format: html, ndiff, unified, context")
     context_lines: int = Field(3, ge=0, description="Number of context lines for unified/context format")
     ignore_whitespace: bool = Field(False, description="Whether to ignore whitespace differences")
@@ -4,7 +4,7 @@ from pydantic import BaseModel, Field
 
 
 class TextStatsInput(BaseModel):
-    text: str
+    text: str = Field(..., max_length=1_000_000, description="Text to analyze (max 1,000,000 characters)")
 
 
 class TextStatsOutput(BaseModel):
@@ -4,7 +4,7 @@ from pydantic import BaseModel, Field
 
 
 class UrlEncoderInput(BaseModel):
-    text: str = Field(..., description="Text to encode or decode")
+    text: str = Field(..., max_length=1_000_000, description="Text to encode or decode (max 1,000,000 characters)")
     mode: str = Field(..., description="Operation mode: encode or decode")
 
 
@@ -4,7 +4,7 @@ from pydantic import BaseModel, Field
 
 
 class UrlParserInput(BaseModel):
-    url: str = Field(..., description="URL to parse")
+    url: str = Field(..., max_length=65_536, description="URL to parse (max 65,536 characters)")
 
 
 class UrlParserOutput(BaseModel):
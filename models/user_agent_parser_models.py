@@ -4,7 +4,7 @@ from pydantic import BaseModel, Field
 
 
 class UserAgentInput(BaseModel):
-    user_agent: str = Field(..., description="User-Agent string to parse")
+    user_agent: str = Field(..., max_length=8192, description="User-Agent string to parse (max 8,192 characters)")
 
 
 class UserAgentOutput(BaseModel):
@@ -5,8 +5,6 @@ from pyfiglet import Figlet, FigletFont
 
 from models.ascii_text_drawer_models import AsciiTextDrawerRequest, AsciiTextDrawerResponse
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/ascii-text-drawer", tags=["ASCII Text Drawer"])
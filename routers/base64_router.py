@@ -8,8 +8,6 @@ from fastapi.responses import StreamingResponse
 from mcp_server.tools import base64_decode_string, base64_encode_string
 from models.base64_models import Base64DecodeFileRequest, InputString, OutputString
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/base64", tags=["Base64"])
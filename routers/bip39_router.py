@@ -6,8 +6,6 @@ from fastapi import APIRouter, HTTPException, status
 from mcp_server.tools.bip39_generator import generate_bip39_mnemonic as generate_bip39_mnemonic_tool
 from models.bip39_models import Bip39Input, Bip39Output
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/bip39", tags=["BIP39 Mnemonic Generator"])
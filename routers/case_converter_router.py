@@ -5,8 +5,6 @@ from fastapi import APIRouter, HTTPException, status
 from mcp_server.tools.case_converter import convert_case
 from models.case_converter_models import CaseConvertInput, CaseConvertOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/case", tags=["Case Converter"])
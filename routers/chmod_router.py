@@ -5,8 +5,6 @@ from fastapi import APIRouter, HTTPException, status
 from mcp_server.tools.chmod_calculator import calculate_numeric_chmod, calculate_symbolic_chmod
 from models.chmod_models import ChmodNumericInput, ChmodNumericOutput, ChmodSymbolicInput, ChmodSymbolicOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/chmod", tags=["chmod"])
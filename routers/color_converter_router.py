@@ -5,8 +5,6 @@ from fastapi import APIRouter, HTTPException, status
 from mcp_server.tools.color_converter import convert_color
 from models.color_converter_models import ColorConvertInput, ColorConvertOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/color", tags=["Color Converter"])
@@ -5,8 +5,6 @@ from fastapi import APIRouter, HTTPException, status
 from mcp_server.tools.cron_parser import describe_cron, validate_cron
 from models.cron_models import CronDescribeOutput, CronInput, CronValidateOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/cron", tags=["Cron"])
@@ -6,8 +6,6 @@ from pydantic import BaseModel, Field
 # Import the tool function
 from mcp_server.tools.eta_calculator import calculate_eta
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/eta", tags=["ETA Calculator"])
@@ -6,8 +6,6 @@ from fastapi import APIRouter, HTTPException, status
 from mcp_server.tools.ipv4_converter import convert_ipv4
 from models.ipv4_converter_models import IPv4Input, IPv4Output
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/ipv4-converter", tags=["IPv4 Address Converter"])
@@ -7,8 +7,6 @@ from fastapi import APIRouter, HTTPException, Query, status
 from mcp_server.tools.ipv6_ula_generator import generate_ipv6_ula as generate_ipv6_ula_tool
 from models.ipv6_ula_models import Ipv6UlaResponse
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/ipv6-ula", tags=["IPv6 ULA Generator"])
@@ -7,8 +7,6 @@ from fastapi import APIRouter, HTTPException, status
 from mcp_server.tools.json_csv_converter import csv_to_json, json_to_csv
 from models.json_csv_converter_models import JsonCsvInput, JsonCsvOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/json-csv-converter", tags=["JSON CSV Converter"])
@@ -8,8 +8,6 @@ from mac_vendor_lookup import InvalidMacError, MacLookup, VendorNotFoundError
 
 from models.mac_address_lookup_models import MacLookupInput, MacLookupOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize the client once
@@ -5,8 +5,6 @@ from fastapi import APIRouter, HTTPException, status
 
 from models.meta_tag_generator_models import MetaTagInput, MetaTagOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/meta-tag-generator", tags=["Meta Tag Generator"])
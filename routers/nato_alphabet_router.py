@@ -5,8 +5,6 @@ from fastapi import APIRouter, HTTPException, status
 
 from models.nato_alphabet_models import NatoInput, NatoOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # NATO phonetic alphabet mapping
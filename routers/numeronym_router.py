@@ -5,8 +5,6 @@ from fastapi import APIRouter, HTTPException, status
 
 from models.numeronym_models import NumeronymInput, NumeronymOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/numeronym", tags=["Numeronym Generator"])
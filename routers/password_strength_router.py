@@ -14,8 +14,6 @@ from models.password_strength_models import (
     SequenceItem,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/password-strength", tags=["Password Strength Analyzer"])
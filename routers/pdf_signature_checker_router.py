@@ -19,8 +19,6 @@ from models.pdf_signature_checker_models import (
     VSummary,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/pdf-signature", tags=["PDF Signature Checker"])
@@ -1,11 +1,15 @@
 import base64
+import functools
 import io
 import logging  # Add logging import
-from typing import Optional
+import os
+import struct
+import zlib
+from typing import Optional, Sequence
 
 import qrcode
-import qrcode.image.svg  # For SVG output
 from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from models.qrcode_models import (
     QrCodeInput,
@@ -16,8 +20,11 @@ from models.qrcode_models import (
     WifiQrCodeInput,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError:  # Optional dependency: pip install orjson
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/qrcode", tags=["QR Code"])
@@ -30,37 +37,136 @@ ERROR_CORRECT_MAP = {
     QrErrorCorrectLevel.H: qrcode.constants.ERROR_CORRECT_H,
 }
 
+QR_BOX_SIZE = 10  # Pixels per module (PNG); qrcode's SVG convention maps 10 px to 1 mm
+QR_BORDER = 4  # Quiet-zone width in modules
+
+# Set QRCODE_PNG_USE_PIL=1 to fall back to Pillow's general-purpose PNG encoder
+USE_PIL_PNG_ENCODER = os.environ.get("QRCODE_PNG_USE_PIL", "").lower() in ("1", "true", "yes")
+
+# Base64 PNG payloads are tens of KB; encode them with orjson when it is installed
+_JSON_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Same elements and attributes as qrcode's SvgPathImage (a single path, one unit (1 mm) per module);
+# serialization whitespace can differ from its lxml or ElementTree output
+_SVG_OPEN = (
+    "<?xml version='1.0' encoding='UTF-8'?>\n"
+    '<svg width="{size}mm" height="{size}mm" version="1.1" viewBox="0 0 {size} {size}" '
+    'xmlns="http://www.w3.org/2000/svg"><path d="'
+)
+_SVG_CLOSE = '" id="qr-path" fill="#000000" fill-opacity="1" fill-rule="nonzero" stroke="none"/></svg>'
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Frame a PNG chunk: length, type, data and CRC over type + data."""
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+def matrix_to_png(matrix: Sequence[Sequence[bool]], box_size: int) -> bytes:
+    """Encode a QR module matrix (border included) as a 1-bit grayscale PNG.
+
+    Dark modules are black (0) and light modules white (1). Each module is scaled
+    to `box_size` x `box_size` pixels; every scanline uses filter type 0 (None).
+    """
+    size = len(matrix) * box_size
+    row_bytes = (size + 7) // 8
+    padding = "1" * (row_bytes * 8 - size)
+
+    dark_bits, light_bits = "0" * box_size, "1" * box_size
+
+    # The filtered image size is known up front: one filter byte plus the packed pixels per scanline
+    block_size = (row_bytes + 1) * box_size
+    raw = bytearray(block_size * len(matrix))
+    view = memoryview(raw)
+    pos = 0
+    for row in matrix:
+        bits = "".join([dark_bits if dark else light_bits for dark in row]) + padding
+        scanline = b"\x00" + int(bits, 2).to_bytes(row_bytes, "big")
+        view[pos : pos + block_size] = scanline * box_size
+        pos += block_size
+
+    # Width, height, bit depth 1, color type 0 (grayscale), default compression/filter/interlace
+    ihdr = struct.pack(">IIBBBBB", size, size, 1, 0, 0, 0, 0)
+    return (
+        _PNG_SIGNATURE + _png_chunk(b"IHDR", ihdr) + _png_chunk(b"IDAT", zlib.compress(raw)) + _png_chunk(b"IEND", b"")
+    )
+
+
+def matrix_to_svg(matrix: Sequence[Sequence[bool]]) -> bytes:
+    """Encode a QR module matrix (border included) as an SVG with one square subpath per dark module."""
+    path = "".join(
+        f"M{x},{y}H{x + 1}V{y + 1}H{x}z" for y, row in enumerate(matrix) for x, dark in enumerate(row) if dark
+    )
+    return (_SVG_OPEN.format(size=len(matrix)) + path + _SVG_CLOSE).encode("utf-8")
+
+
+def _make_qr(data: str, error_correction: int) -> qrcode.QRCode:
+    qr = qrcode.QRCode(
+        version=None,  # Auto-detect version
+        error_correction=error_correction,
+        box_size=QR_BOX_SIZE,
+        border=QR_BORDER,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr
 
-@router.post("/generate")  # Output depends on format, handled manually
-async def generate_qr_code(payload: QrCodeInput):
-    """Generate a QR code image (SVG or PNG)."""
-    try:
-        qr = qrcode.QRCode(
-            version=None,  # Auto-detect version
-            error_correction=ERROR_CORRECT_MAP.get(payload.error_correction, qrcode.constants.ERROR_CORRECT_M),
-            box_size=10,  # Default, can be made configurable
-            border=4,  # Default, can be made configurable
-        )
-        qr.add_data(payload.text)
-        qr.make(fit=True)
 
+@functools.lru_cache(maxsize=256)
+def _qr_matrix(data: str, error_correction: int) -> tuple[tuple[bool, ...], ...]:
+    """Module matrix (border included) for `data`; the expensive, format-independent step."""
+    return tuple(tuple(row) for row in _make_qr(data, error_correction).get_matrix())
+
+
+@functools.lru_cache(maxsize=512)
+def _render_qr(data: str, error_correction: int, output_format: QrOutputFormat) -> bytes:
+    """Build the QR code for `data` and serialize it as SVG or PNG bytes.
+
+    Keyed on primitives only, so repeated payloads (known URLs, WiFi posters)
+    skip the matrix build and image encoding entirely. SVG and PNG renderings
+    of the same payload share one cached matrix.
+    """
+    if output_format == QrOutputFormat.svg:
+        return matrix_to_svg(_qr_matrix(data, error_correction))
+    if USE_PIL_PNG_ENCODER:
         img_buffer = io.BytesIO()
+        img = _make_qr(data, error_correction).make_image(fill_color="black", back_color="white")
+        img.save(img_buffer, format="PNG")
+        return img_buffer.getvalue()
+    return matrix_to_png(_qr_matrix(data, error_correction), QR_BOX_SIZE)
+
+
+# Output depends on format, handled manually
+_QR_RESPONSES = {
+    200: {
+        "description": "SVG document (svg), raw PNG bytes (png_binary) or JSON with Base64 PNG data (png).",
+        "content": {"image/svg+xml": {}, "image/png": {}, "application/json": {}},
+    }
+}
+
+
+@router.post("/generate", response_class=_JSON_RESPONSE_CLASS, responses=_QR_RESPONSES)
+async def generate_qr_code(payload: QrCodeInput):
+    """Generate a QR code image (SVG, raw PNG or Base64 PNG)."""
+    try:
+        error_correction = ERROR_CORRECT_MAP.get(payload.error_correction, qrcode.constants.ERROR_CORRECT_M)
         output_format = payload.output_format
 
         if output_format == QrOutputFormat.svg:
-            # Use SVG factory
-            img = qr.make_image(image_factory=qrcode.image.svg.SvgPathImage)
-            img.save(img_buffer)
-            svg_data = img_buffer.getvalue().decode("utf-8")
-            # Return SVG directly with appropriate media type
+            svg_data = _render_qr(payload.text, error_correction, output_format)
+            # Return SVG bytes directly with appropriate media type (no decode/re-encode round-trip)
             return Response(content=svg_data, media_type="image/svg+xml")
 
         elif output_format == QrOutputFormat.png:
-            img = qr.make_image(fill_color="black", back_color="white")
-            img.save(img_buffer, format="PNG")
-            png_data_b64 = base64.b64encode(img_buffer.getvalue()).decode("utf-8")
+            png_data_b64 = base64.b64encode(_render_qr(payload.text, error_correction, output_format)).decode("ascii")
             # Return Base64 PNG data in a JSON structure
             return QrCodeOutput(qr_code_data=png_data_b64, output_format=output_format)
+
+        elif output_format == QrOutputFormat.png_binary:
+            # Raw PNG bytes: no Base64 or JSON overhead. Shares the PNG render cache entry.
+            png_data = _render_qr(payload.text, error_correction, QrOutputFormat.png)
+            return Response(content=png_data, media_type="image/png")
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -82,17 +188,18 @@ async def generate_qr_code(payload: QrCodeInput):
 # --- WiFi QR Code Endpoint ---
 
 
+# Escape special characters: \, ;, ,, ", :
+_WIFI_ESCAPE = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", '"': '\\"', ":": "\\:"})
+
+
+def escape_wifi_value(value: str) -> str:
+    """Escape a value for the WIFI: string in a single translate pass."""
+    return value.translate(_WIFI_ESCAPE) if value else ""
+
+
 def format_wifi_string(ssid: str, auth_type: WifiAuthType, password: Optional[str], hidden: bool) -> str:
     "Formats the special WIFI: string for QR codes."
 
-    # Escape special characters: \, ;, ,, ", :
-    def escape_wifi_value(value: str) -> str:
-        if not value:
-            return ""
-        return (
-            value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace('"', '\\"').replace(":", "\\:")
-        )
-
     escaped_ssid = escape_wifi_value(ssid)
     escaped_password = escape_wifi_value(password or "")
 
@@ -113,7 +220,8 @@ def format_wifi_string(ssid: str, auth_type: WifiAuthType, password: Optional[st
     return f"WIFI:T:{auth_str};S:{escaped_ssid};P:{escaped_password};H:{hidden_str};;"
 
 
-@router.post("/generate-wifi")  # Similar output structure to /generate
+# Similar output structure to /generate
+@router.post("/generate-wifi", response_class=_JSON_RESPONSE_CLASS, responses=_QR_RESPONSES)
 async def generate_wifi_qr_code(payload: WifiQrCodeInput):
     """Generate a QR code for connecting to a WiFi network.
 
@@ -133,30 +241,21 @@ async def generate_wifi_qr_code(payload: WifiQrCodeInput):
 
         logger.info(f"Generating WiFi QR code for SSID: {payload.ssid}")
 
-        # --- Reuse QR generation logic --- (Copied and adapted from /generate)
-        qr = qrcode.QRCode(
-            version=None,  # Auto-detect version
-            error_correction=ERROR_CORRECT_MAP.get(payload.error_correction, qrcode.constants.ERROR_CORRECT_M),
-            box_size=10,  # Default, can be made configurable
-            border=4,  # Default, can be made configurable
-        )
-        qr.add_data(wifi_string)
-        qr.make(fit=True)
-
-        img_buffer = io.BytesIO()
+        # --- Reuse QR generation logic ---
+        error_correction = ERROR_CORRECT_MAP.get(payload.error_correction, qrcode.constants.ERROR_CORRECT_M)
         output_format = payload.output_format
 
         if output_format == QrOutputFormat.svg:
-            img = qr.make_image(image_factory=qrcode.image.svg.SvgPathImage)
-            img.save(img_buffer)
-            svg_data = img_buffer.getvalue().decode("utf-8")
+            svg_data = _render_qr(wifi_string, error_correction, output_format)
             return Response(content=svg_data, media_type="image/svg+xml")
 
         elif output_format == QrOutputFormat.png:
-            img = qr.make_image(fill_color="black", back_color="white")
-            img.save(img_buffer, format="PNG")
-            png_data_b64 = base64.b64encode(img_buffer.getvalue()).decode("utf-8")
+            png_data_b64 = base64.b64encode(_render_qr(wifi_string, error_correction, output_format)).decode("ascii")
             return QrCodeOutput(qr_code_data=png_data_b64, output_format=output_format)
+
+        elif output_format == QrOutputFormat.png_binary:
+            png_data = _render_qr(wifi_string, error_correction, QrOutputFormat.png)
+            return Response(content=png_data, media_type="image/png")
         else:
             # Should be caught by Pydantic, but safeguard
             raise HTTPException(
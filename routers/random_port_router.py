@@ -1,15 +1,22 @@
+import array
+import bisect
+import functools
 import logging
 import random
 import socket
-from typing import List, Set
+from typing import List, Optional, Set
 
 from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 
 from models.random_port_models import PortResponse
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError:  # Optional dependency: pip install orjson
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/random-port", tags=["Random Port Generator"])
@@ -45,6 +52,11 @@ COMMON_PORTS_TO_EXCLUDE: Set[int] = {
     8080,
     8000,  # Common alt HTTP
 }
+# Sorted, contiguous copy of the common ports so a range can be sliced out with bisect
+_COMMON_PORTS_SORTED = array.array("H", sorted(COMMON_PORTS_TO_EXCLUDE))
+
+# Encode port lists with orjson when it is installed
+_JSON_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
 
 # Port Ranges Definition
 WELL_KNOWN_PORTS = (0, 1023)
@@ -52,6 +64,15 @@ REGISTERED_PORTS = (1024, 49151)
 EPHEMERAL_PORTS = (49152, 65535)
 
 
+@functools.lru_cache(maxsize=4096)
+def _service_name(port: int, protocol: str) -> Optional[str]:
+    """Look up the services-database name for a port, memoized to avoid repeated NSS lookups."""
+    try:
+        return socket.getservbyport(port, protocol)
+    except OSError:
+        return None  # Port not assigned a common service name for the protocol
+
+
 # Response model for returning a list of ports
 class PortListResponse(BaseModel):
     ports: List[int] = Field(..., description="A list of generated random ports.")
@@ -102,11 +123,7 @@ async def generate_random_port(
                 range_type_str = "Ephemeral (Dynamic/Private)"
 
         # Try to get common service name
-        service_name = None
-        try:
-            service_name = socket.getservbyport(random_port, protocol)
-        except OSError:
-            pass  # Port not assigned a common service name for the protocol
+        service_name = _service_name(random_port, protocol)
 
         return PortResponse(port=random_port, range_type=range_type_str, service_name=service_name)
 
@@ -120,7 +137,12 @@ async def generate_random_port(
         )
 
 
-@router.get("/generate", response_model=PortListResponse, summary="Generate random network ports")
+@router.get(
+    "/generate",
+    response_model=PortListResponse,
+    response_class=_JSON_RESPONSE_CLASS,
+    summary="Generate random network ports",
+)
 async def generate_random_ports(
     count: int = Query(1, description="Number of random ports to generate.", ge=1, le=100),
     min_port: int = Query(
@@ -166,9 +188,11 @@ async def generate_random_ports(
 
     # Calculate the size of the valid range
     available_range_size = max_port - actual_min + 1
-    exclusions: Set[int] = set()
+    exclusions = _COMMON_PORTS_SORTED[:0]
     if exclude_common:
-        exclusions = {p for p in COMMON_PORTS_TO_EXCLUDE if actual_min <= p <= max_port}
+        lo = bisect.bisect_left(_COMMON_PORTS_SORTED, actual_min)
+        hi = bisect.bisect_right(_COMMON_PORTS_SORTED, max_port)
+        exclusions = _COMMON_PORTS_SORTED[lo:hi]  # Already sorted
         available_range_size -= len(exclusions)
 
     if available_range_size <= 0:
@@ -183,30 +207,20 @@ async def generate_random_ports(
         # Allow duplicates in this case, maybe return error?
         # For now, just generate with replacement if count is too high
 
-    generated_ports = []
-    attempts = 0
-    max_attempts = count * 5 + 100  # Safety break for tight ranges/exclusions
+    # Sample positions among the available ports, then shift each position past the
+    # excluded ports below it. The k-th sorted exclusion has (excluded - actual_min - k)
+    # available positions before it, so one bisect per port finds the shift.
+    # No rejection loop, no materialized population.
+    exclusion_positions = [excluded - actual_min - k for k, excluded in enumerate(exclusions)]
 
     try:
-        # If count is small relative to range, random.randint is fine
-        # If count is large, generating all possibilities and sampling might be better, but more complex
-        while len(generated_ports) < count and attempts < max_attempts:
-            attempts += 1
-            port = random.randint(actual_min, max_port)
-            if exclude_common and port in exclusions:
-                continue
-            generated_ports.append(port)
-
-        if len(generated_ports) < count:
-            logger.warning(
-                f"Could only generate {len(generated_ports)} unique ports out of {count} requested after {max_attempts} attempts."
-            )
-            # Decide: return partial list or raise error? Returning partial for now.
-            if not generated_ports:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to generate any ports within the constraints.",
-                )
+        positions = range(available_range_size)
+        if count <= available_range_size:
+            sampled = random.sample(positions, count)
+        else:
+            # Not enough unique ports (warned above): sample with replacement
+            sampled = random.choices(positions, k=count)
+        generated_ports = [actual_min + i + bisect.bisect_right(exclusion_positions, i) for i in sampled]
 
         return PortListResponse(ports=generated_ports)
 
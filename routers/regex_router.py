@@ -1,11 +1,39 @@
+import functools
+import logging
 import re
 
 from fastapi import APIRouter, HTTPException, status
 
-from models.regex_models import RegexInput, RegexMatch, RegexOutput
+from models.regex_models import RegexEngine, RegexInput, RegexMatch, RegexOutput
+
+try:
+    import re2
+except ImportError:  # Optional dependency: pip install google-re2
+    re2 = None
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/regex", tags=["Regex"])
 
+# RE2 takes flags inline rather than as an argument
+_RE2_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(pattern: str, flags: int, engine: RegexEngine = RegexEngine.re):
+    """Compile and memoize a pattern; re.error propagates and is never cached.
+
+    With the re2 engine the pattern is compiled by RE2 when it is installed and
+    supports the pattern, otherwise by re. Both expose the finditer/Match API used below.
+    """
+    if engine == RegexEngine.re2 and re2 is not None:
+        inline = "".join(letter for flag, letter in _RE2_INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+        except re2.error as e:
+            logger.info(f"RE2 cannot compile pattern, falling back to re: {e}")
+    return re.compile(pattern, flags)
+
 
 @router.post("/test", response_model=RegexOutput)
 async def test_regex(payload: RegexInput):
@@ -20,7 +48,7 @@ async def test_regex(payload: RegexInput):
 
     matches_list = []
     try:
-        compiled_regex = re.compile(payload.regex_pattern, flags)
+        compiled_regex = _compile(payload.regex_pattern, flags, payload.engine)
 
         for i, match in enumerate(compiled_regex.finditer(payload.test_string)):
             matches_list.append(
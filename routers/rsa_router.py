@@ -1,38 +1,94 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import get_args
+
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi import APIRouter, HTTPException, status
 
-from models.rsa_models import RsaKeygenInput, RsaKeygenOutput
-
-router = APIRouter(prefix="/api/rsa", tags=["RSA"])
+from models.rsa_models import KeySize, RsaKeygenInput, RsaKeygenOutput
 
 PUBLIC_EXPONENT = 65537
 
+# Number of pregenerated key pairs kept ready per key size (0 disables the pool)
+KEY_POOL_SIZE = int(os.environ.get("RSA_KEY_POOL_SIZE", "2"))
+
+# Pregenerated (private_pem, public_pem) pairs per key size. Pools fill lazily: a key size is only
+# pregenerated after it has been requested, so nothing is generated at startup.
+_key_pools: dict[int, queue.Queue] = {key_size: queue.Queue() for key_size in get_args(KeySize)}
+_pending_refills: dict[int, int] = dict.fromkeys(get_args(KeySize), 0)
+_refill_lock = threading.Lock()
+# One background thread, so refills never compete with request threads for more than one core
+_refill_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rsa-key-pool")
+
+
+def _generate_key_pair(key_size: int) -> tuple[str, str]:
+    """Generate an RSA key pair and return (private_pem, public_pem).
+
+    CPU-bound (50 ms to seconds); OpenSSL releases the GIL, so it runs well in a worker thread.
+    """
+    private_key = rsa.generate_private_key(
+        public_exponent=PUBLIC_EXPONENT,
+        key_size=key_size,
+        backend=default_backend(),
+    )
+    public_key = private_key.public_key()
+
+    # Serialize private key to PEM (PKCS8 format, unencrypted)
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode("utf-8")
+
+    # Serialize public key to PEM (SubjectPublicKeyInfo format)
+    public_pem = public_key.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode("utf-8")
+
+    return private_pem, public_pem
 
+
+def _refill_one(key_size: int) -> None:
+    """Generate one key pair into the pool for `key_size` (runs on the refill thread)."""
+    key_pair = None
+    try:
+        key_pair = _generate_key_pair(key_size)
+    finally:
+        # Publish the key and drop the pending count together, so pool plus pending never overshoots
+        with _refill_lock:
+            if key_pair is not None:
+                _key_pools[key_size].put_nowait(key_pair)
+            _pending_refills[key_size] -= 1
+
+
+def _schedule_refills(key_size: int) -> None:
+    """Queue enough background generations to bring the pool for `key_size` back to KEY_POOL_SIZE."""
+    with _refill_lock:
+        missing = KEY_POOL_SIZE - _key_pools[key_size].qsize() - _pending_refills[key_size]
+        for _ in range(missing):
+            _pending_refills[key_size] += 1
+            _refill_executor.submit(_refill_one, key_size)
+
+
+router = APIRouter(prefix="/api/rsa", tags=["RSA"])
+
+
+# Plain def: a pool miss generates the key inline, so FastAPI runs the handler in its threadpool
 @router.post("/generate-keys", response_model=RsaKeygenOutput)
-async def generate_rsa_keys(payload: RsaKeygenInput):
+def generate_rsa_keys(payload: RsaKeygenInput):
     """Generate an RSA public/private key pair in PEM format."""
     try:
-        private_key = rsa.generate_private_key(
-            public_exponent=PUBLIC_EXPONENT,
-            key_size=payload.key_size,
-            backend=default_backend(),
-        )
-        public_key = private_key.public_key()
-
-        # Serialize private key to PEM (PKCS8 format, unencrypted)
-        private_pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption(),
-        ).decode("utf-8")
-
-        # Serialize public key to PEM (SubjectPublicKeyInfo format)
-        public_pem = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        ).decode("utf-8")
+        try:
+            # Each pooled key pair is handed out exactly once
+            private_pem, public_pem = _key_pools[payload.key_size].get_nowait()
+        except queue.Empty:
+            private_pem, public_pem = _generate_key_pair(payload.key_size)
+        _schedule_refills(payload.key_size)
 
         return {
             "private_key_pem": private_pem,
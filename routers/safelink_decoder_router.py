@@ -1,18 +1,72 @@
+import functools
 import logging
 import re
-from typing import Optional, Tuple
-from urllib.parse import parse_qs, unquote, urlparse
+from typing import Dict, Optional, Tuple
+from urllib.parse import unquote, unquote_plus
 
 from fastapi import APIRouter, HTTPException, status
 
 from models.safelink_decoder_models import SafelinkInput, SafelinkOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/safelink-decoder", tags=["Safelink Decoder"])
 
+# Provider URL patterns, compiled once at import
+_MS_SAFELINK_RE = re.compile(
+    r"https?://(?:[a-zA-Z0-9][-a-zA-Z0-9]*[a-zA-Z0-9]\.)*safelinks\.protection\.outlook\.com/.*?url="
+)
+_GOOGLE_SAFELINK_RES = (
+    re.compile(r"https?://www\.google\.com/url\?.*?url="),
+    re.compile(r"https?://security\.google\.com/url\?"),
+)
+_HTTP_PREFIX_RE = re.compile(r"^https?://")
+
+# Common redirect parameter names, in lookup order
+_REDIRECT_PARAMS = (
+    "url",
+    "link",
+    "target",
+    "dest",
+    "destination",
+    "redirect",
+    "redirectUrl",
+    "redirect_uri",
+    "u",
+    "r",
+)
+
+
+def _query_params(url: str) -> Dict[str, str]:
+    """Map each query parameter to its first non-blank raw (still percent-encoded) value.
+
+    A minimal stand-in for parse_qs(urlparse(url).query): the query is the text between
+    the first "?" and the fragment, blank values are skipped, and only parameter names
+    are decoded here. Values are decoded on demand by _param_value.
+    """
+    fragment_start = url.find("#")
+    if fragment_start >= 0:
+        url = url[:fragment_start]
+    query_start = url.find("?")
+    if query_start < 0:
+        return {}
+
+    params: Dict[str, str] = {}
+    for pair in url[query_start + 1 :].split("&"):
+        name, has_value, value = pair.partition("=")
+        if has_value and value:
+            params.setdefault(unquote_plus(name), value)
+    return params
+
+
+def _param_value(params: Dict[str, str], name: str) -> str:
+    """Decode a parameter value as parse_qs would, then unquote once more for doubly encoded targets."""
+    return unquote(unquote_plus(params[name]))
+
+
+# Longer URLs are decoded directly so the cache never pins large strings
+SAFELINK_CACHE_MAX_URL_LENGTH = 4096
+
 
 @router.post("/", response_model=SafelinkOutput)
 async def decode_safelink(input_data: SafelinkInput):
@@ -22,18 +76,13 @@ async def decode_safelink(input_data: SafelinkInput):
         if not url:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="URL cannot be empty")
 
-        # Try different decoding methods
-        decoders = [
-            decode_microsoft_safelink,
-            decode_google_safelink,
-            decode_proofpoint_safelink,
-            decode_generic_redirect,
-        ]
+        if len(url) <= SAFELINK_CACHE_MAX_URL_LENGTH:
+            decoded_url, method = _decode_url_cached(url)
+        else:
+            decoded_url, method = _decode_url(url)
 
-        for decoder in decoders:
-            decoded_url, method = decoder(url)
-            if decoded_url:
-                return SafelinkOutput(original_url=url, decoded_url=decoded_url, decoding_method=method)
+        if decoded_url:
+            return SafelinkOutput(original_url=url, decoded_url=decoded_url, decoding_method=method)
 
         # If no decoder worked
         return SafelinkOutput(original_url=input_data.url, error="Unable to decode URL with any known method")
@@ -45,19 +94,14 @@ async def decode_safelink(input_data: SafelinkInput):
         return SafelinkOutput(original_url=input_data.url, error=f"Error during URL decoding: {str(e)}")
 
 
-def decode_microsoft_safelink(url: str) -> Tuple[Optional[str], Optional[str]]:
+def decode_microsoft_safelink(url: str, params: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
     """Decode Microsoft Office 365 ATP Safe Links."""
-    ms_pattern = r"https?://(?:[a-zA-Z0-9][-a-zA-Z0-9]*[a-zA-Z0-9]\.)*safelinks\.protection\.outlook\.com/.*?url="
-    if re.match(ms_pattern, url):
+    if _MS_SAFELINK_RE.match(url):
         try:
             # Extract the URL parameter
-            parsed = urlparse(url)
-            params = parse_qs(parsed.query)
-
             if "url" in params:
-                decoded_url = params["url"][0]
                 # URL decode the extracted URL
-                decoded_url = unquote(decoded_url)
+                decoded_url = _param_value(params, "url")
                 return decoded_url, "Microsoft Safe Links"
         except Exception as e:
             logger.warning(f"Error decoding Microsoft safelink: {e}")
@@ -65,25 +109,18 @@ def decode_microsoft_safelink(url: str) -> Tuple[Optional[str], Optional[str]]:
     return None, None
 
 
-def decode_google_safelink(url: str) -> Tuple[Optional[str], Optional[str]]:
+def decode_google_safelink(url: str, params: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
     """Decode Google Safe Browsing redirects."""
-    google_patterns = [r"https?://www\.google\.com/url\?.*?url=", r"https?://security\.google\.com/url\?"]
-
-    for pattern in google_patterns:
-        if re.match(pattern, url):
+    for pattern in _GOOGLE_SAFELINK_RES:
+        if pattern.match(url):
             try:
-                parsed = urlparse(url)
-                params = parse_qs(parsed.query)
-
                 if "url" in params:
-                    decoded_url = params["url"][0]
-                    decoded_url = unquote(decoded_url)
+                    decoded_url = _param_value(params, "url")
                     return decoded_url, "Google Safe Browsing"
                 elif "q" in params:
-                    potential_url = params["q"][0]
-                    unquoted_potential = unquote(potential_url)
+                    unquoted_potential = _param_value(params, "q")
                     # Basic check if it looks like a URL after unquoting
-                    if re.match(r"^https?://", unquoted_potential):
+                    if _HTTP_PREFIX_RE.match(unquoted_potential):
                         return unquoted_potential, "Google Search Redirect"
                     # If q param doesn't look like a URL, ignore it (could be search term)
             except Exception as e:
@@ -92,7 +129,7 @@ def decode_google_safelink(url: str) -> Tuple[Optional[str], Optional[str]]:
     return None, None
 
 
-def decode_proofpoint_safelink(url: str) -> Tuple[Optional[str], Optional[str]]:
+def decode_proofpoint_safelink(url: str, params: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
     """Decode Proofpoint URL Defense links."""
     if "urldefense.proofpoint.com" in url:
         try:
@@ -106,21 +143,16 @@ def decode_proofpoint_safelink(url: str) -> Tuple[Optional[str], Optional[str]]:
 
             # Proofpoint v2
             if "/v2/" in url:
-                params_v2 = parse_qs(urlparse(url).query)
-                if "u" in params_v2:
+                if "u" in params:
                     # Proper v2 decoding is complex and not implemented here.
                     # Return None, indicating we recognized but couldn't decode.
                     return None, "Proofpoint URL Defense v2 (Decoding not supported)"
 
             # Newer Proofpoint formats
-            parsed = urlparse(url)
-            params = parse_qs(parsed.query)
-
             # Try to find URL parameter with different names
             for param in ["url", "u", "r"]:
                 if param in params:
-                    decoded_url = params[param][0]
-                    decoded_url = unquote(decoded_url)
+                    decoded_url = _param_value(params, param)
                     return decoded_url, "Proofpoint URL Defense"
         except Exception as e:
             logger.warning(f"Error decoding Proofpoint safelink: {e}")
@@ -128,30 +160,39 @@ def decode_proofpoint_safelink(url: str) -> Tuple[Optional[str], Optional[str]]:
     return None, None
 
 
-def decode_generic_redirect(url: str) -> Tuple[Optional[str], Optional[str]]:
+def decode_generic_redirect(url: str, params: Dict[str, str]) -> Tuple[Optional[str], Optional[str]]:
     """Try to decode generic URL redirects with common parameter names."""
     try:
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-
-        # Common redirect parameter names
-        for param in [
-            "url",
-            "link",
-            "target",
-            "dest",
-            "destination",
-            "redirect",
-            "redirectUrl",
-            "redirect_uri",
-            "u",
-            "r",
-        ]:
+        for param in _REDIRECT_PARAMS:
             if param in params:
-                decoded_url = params[param][0]
-                decoded_url = unquote(decoded_url)
+                decoded_url = _param_value(params, param)
                 return decoded_url, f"Generic Redirect (param: {param})"
     except Exception as e:
         logger.warning(f"Error decoding generic redirect: {e}")
 
     return None, None
+
+
+# Try different decoding methods, in order
+_DECODERS = (
+    decode_microsoft_safelink,
+    decode_google_safelink,
+    decode_proofpoint_safelink,
+    decode_generic_redirect,
+)
+
+
+def _decode_url(url: str) -> Tuple[Optional[str], Optional[str]]:
+    """Run the decoders in order on a stripped URL; returns (decoded_url, method) or (None, None)."""
+    # Parse the query once; each decoder only runs its cheap provider check against the raw URL
+    params = _query_params(url)
+
+    for decoder in _DECODERS:
+        decoded_url, method = decoder(url, params)
+        if decoded_url:
+            return decoded_url, method
+    return None, None
+
+
+# Decoding is deterministic per URL, and the same links recur (re-scans, bulk analysis)
+_decode_url_cached = functools.lru_cache(maxsize=8192)(_decode_url)
@@ -1,17 +1,39 @@
+import functools
+
 from fastapi import APIRouter, HTTPException, status
 from slugify import slugify  # Import python-slugify
 
-from models.slugify_models import SlugifyInput, SlugifyOutput
+from models.slugify_models import (
+    SlugifyBatchInput,
+    SlugifyBatchOutput,
+    SlugifyInput,
+    SlugifyOutput,
+)
 
 router = APIRouter(prefix="/api/slugify", tags=["Slugify"])
 
+# Longer inputs are slugified directly so the cache never pins large strings
+SLUG_CACHE_MAX_TEXT_LENGTH = 1024
+# Combined length of all texts in one batch; larger batches are rejected with 413
+BATCH_MAX_TOTAL_LENGTH = 1_000_000
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_slug(text: str) -> str:
+    """Memoized slugify: transliteration plus several regex passes, deterministic per input."""
+    return slugify(text)
+
+
+def _slug(text: str) -> str:
+    return _cached_slug(text) if len(text) <= SLUG_CACHE_MAX_TEXT_LENGTH else slugify(text)
+
 
 @router.post("/create", response_model=SlugifyOutput)
 async def create_slug(payload: SlugifyInput):
     """Convert a string into a URL-friendly slug."""
     try:
         # Basic slugify, options like separator, max_length can be added
-        result_slug = slugify(payload.text)
+        result_slug = _slug(payload.text)
         return {"slug": result_slug}
     except Exception as e:
         print(f"Error creating slug: {e}")
@@ -19,3 +41,22 @@ async def create_slug(payload: SlugifyInput):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during slug creation",
         )
+
+
+@router.post("/create/batch", response_model=SlugifyBatchOutput)
+async def create_slugs(payload: SlugifyBatchInput):
+    """Convert many strings into URL-friendly slugs in one request; slugs are in input order."""
+    if sum(map(len, payload.texts)) > BATCH_MAX_TOTAL_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch too large: the texts may total at most {BATCH_MAX_TOTAL_LENGTH} characters.",
+        )
+
+    try:
+        return {"slugs": [_slug(text) for text in payload.texts]}
+    except Exception as e:
+        print(f"Error creating slugs: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error during slug creation",
+        )
@@ -6,8 +6,9 @@ from models.sql_formatter_models import SqlFormatInput, SqlFormatOutput
 router = APIRouter(prefix="/api/sql", tags=["SQL"])
 
 
+# Plain def: sqlparse is pure Python and slow on large input, so FastAPI runs this in its threadpool
 @router.post("/format", response_model=SqlFormatOutput)
-async def format_sql(payload: SqlFormatInput):
+def format_sql(payload: SqlFormatInput):
     """Format/prettify an SQL query string."""
     try:
         formatted = sqlparse.format(
@@ -1,10 +1,9 @@
 import logging
+from typing import Annotated, List
 
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/string-obfuscator", tags=["String Obfuscator"])
@@ -18,54 +17,37 @@ ASCII_START = 33
 ASCII_END = 126
 # Special case for space (ASCII 32)
 FULL_WIDTH_SPACE = "\u3000"  # Ideographic Space
+# Combined length of all texts in one batch; larger batches are rejected with 413
+BATCH_MAX_TOTAL_LENGTH = 1_000_000
+
+
+# Translation tables built once: printable ASCII (letters, numbers, punctuation) maps by offset, space separately
+_OBF_TABLE = {ord(" "): ord(FULL_WIDTH_SPACE), **{c: c + FULL_WIDTH_OFFSET for c in range(ASCII_START, ASCII_END + 1)}}
+_DEOBF_TABLE = {full_width: ascii_val for ascii_val, full_width in _OBF_TABLE.items()}
 
 
 def obfuscate_to_full_width(text: str) -> str:
     "Converts specific ASCII characters (letters, numbers, basic punctuation, space) to full-width."
-    obfuscated_chars = []
-    for char in text:
-        ascii_val = ord(char)
-        if char == " ":
-            obfuscated_chars.append(FULL_WIDTH_SPACE)
-        # Check ranges for A-Z, a-z, 0-9
-        elif (
-            ord("A") <= ascii_val <= ord("Z") or ord("a") <= ascii_val <= ord("z") or ord("0") <= ascii_val <= ord("9")
-        ):
-            obfuscated_chars.append(chr(ascii_val + FULL_WIDTH_OFFSET))
-        # Check specific punctuation within the ASCII range that has full-width forms
-        elif ASCII_START <= ascii_val <= ASCII_END:
-            # Map only specific punctuation that typically have full-width forms
-            # Example: Convert ! " # $ % & ' ( ) * + , - . / : ; < = > ? @ [ \ ] ^ _ ` { | } ~
-            # We map by offset, assuming direct correspondence for this range subset
-            # Characters not explicitly having a direct map by offset might need a lookup table if required
-            obfuscated_chars.append(chr(ascii_val + FULL_WIDTH_OFFSET))
-        else:
-            obfuscated_chars.append(char)  # Keep other chars (non-ASCII, control chars) as is
-    return "".join(obfuscated_chars)
+    # Other chars (non-ASCII, control chars) are kept as is
+    return text.translate(_OBF_TABLE)
 
 
 def deobfuscate_from_full_width(text: str) -> str:
     "Converts full-width Unicode characters back to their standard ASCII equivalents."
-    deobfuscated_chars = []
-    for char in text:
-        if char == FULL_WIDTH_SPACE:
-            deobfuscated_chars.append(" ")
-        else:
-            char_code = ord(char)
-            # Calculate potential original ASCII value
-            original_ascii_val = char_code - FULL_WIDTH_OFFSET
-            # Check if the original value falls within the convertible ranges/chars
-            if (
-                (ord("A") <= original_ascii_val <= ord("Z"))
-                or (ord("a") <= original_ascii_val <= ord("z"))
-                or (ord("0") <= original_ascii_val <= ord("9"))
-                or (ASCII_START <= original_ascii_val <= ASCII_END)
-            ):  # Assuming punctuation was mapped directly
-                deobfuscated_chars.append(chr(original_ascii_val))
-            else:
-                # Keep characters that aren't recognized full-width equivalents as is
-                deobfuscated_chars.append(char)
-    return "".join(deobfuscated_chars)
+    # Full-width characters are all non-ASCII, so plain ASCII input has nothing to convert
+    if text.isascii():
+        return text
+    # Characters that aren't recognized full-width equivalents are kept as is
+    return text.translate(_DEOBF_TABLE)
+
+
+def _check_batch_size(texts: List[str]) -> None:
+    """Reject batches whose texts together exceed BATCH_MAX_TOTAL_LENGTH."""
+    if sum(map(len, texts)) > BATCH_MAX_TOTAL_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch too large: the texts may total at most {BATCH_MAX_TOTAL_LENGTH} characters.",
+        )
 
 
 # --- API Models ---
@@ -79,6 +61,18 @@ class ObfuscatorOutput(BaseModel):
     result: str = Field(..., description="The resulting obfuscated or deobfuscated text.")
 
 
+class ObfuscatorBatchInput(BaseModel):
+    texts: List[Annotated[str, Field(max_length=100_000)]] = Field(
+        ...,
+        max_length=1000,
+        description="The texts to obfuscate or deobfuscate (max 1000, each at most 100,000 characters).",
+    )
+
+
+class ObfuscatorBatchOutput(BaseModel):
+    results: List[str] = Field(..., description="The resulting texts, in input order.")
+
+
 # --- API Endpoints ---
 
 
@@ -116,3 +110,39 @@ async def deobfuscate_string(payload: ObfuscatorInput):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error during string deobfuscation: {str(e)}",
         )
+
+
+@router.post(
+    "/obfuscate/full-width/batch",
+    response_model=ObfuscatorBatchOutput,
+    summary="Obfuscate many texts using full-width Unicode characters",
+)
+async def obfuscate_strings(payload: ObfuscatorBatchInput):
+    """Batch variant of /obfuscate/full-width: one request, results in input order."""
+    _check_batch_size(payload.texts)
+    try:
+        return ObfuscatorBatchOutput(results=[obfuscate_to_full_width(text) for text in payload.texts])
+    except Exception as e:
+        logger.error(f"Error obfuscating strings: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error during string obfuscation: {str(e)}",
+        )
+
+
+@router.post(
+    "/deobfuscate/full-width/batch",
+    response_model=ObfuscatorBatchOutput,
+    summary="Deobfuscate many texts from full-width Unicode characters",
+)
+async def deobfuscate_strings(payload: ObfuscatorBatchInput):
+    """Batch variant of /deobfuscate/full-width: one request, results in input order."""
+    _check_batch_size(payload.texts)
+    try:
+        return ObfuscatorBatchOutput(results=[deobfuscate_from_full_width(text) for text in payload.texts])
+    except Exception as e:
+        logger.error(f"Error deobfuscating strings: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error during string deobfuscation: {str(e)}",
+        )
@@ -1,57 +1,70 @@
 import base64
+import html
 import logging
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 from models.svg_placeholder_models import SvgInput, SvgOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/svg-placeholder", tags=["SVG Placeholder Generator"])
 
 
+def build_svg(input_data: SvgInput) -> str:
+    """Render the placeholder SVG document for validated input."""
+    width = input_data.width
+    height = input_data.height
+    bg_color = input_data.bg_color
+    text_color = input_data.text_color
+    text = input_data.text
+    font_family = input_data.font_family
+    font_size = input_data.font_size
+
+    # Auto-calculate font size if not provided
+    if not font_size:
+        # Simple heuristic: font size proportional to smaller dimension
+        font_size = min(width, height) // 5
+        if font_size < 10:
+            font_size = 10  # Minimum size
+
+    # Construct SVG content
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
+        f'<rect fill="{bg_color}" width="{width}" height="{height}"/>',
+    ]
+
+    # Add text if provided
+    if text:
+        # Center text
+        text_x = width / 2
+        text_y = height / 2
+        # Escape user-supplied strings so they can't break out of the attribute/element
+        parts.append(
+            f'<text x="{text_x}" y="{text_y}" '
+            f'font-family="{html.escape(font_family)}" font-size="{font_size}" '
+            f'fill="{text_color}" text-anchor="middle" dy=".3em">'
+            f"{html.escape(text, quote=False)}"
+            f"</text>"
+        )
+
+    parts.append("</svg>")
+    return "".join(parts)
+
+
 @router.post("/", response_model=SvgOutput)
 async def generate_svg_placeholder(input_data: SvgInput):
     """Generate an SVG placeholder image with specified dimensions, colors, and text."""
     try:
-        width = input_data.width
-        height = input_data.height
-        bg_color = input_data.bg_color
-        text_color = input_data.text_color
-        text = input_data.text
-        font_family = input_data.font_family
-        font_size = input_data.font_size
-
-        # Auto-calculate font size if not provided
-        if not font_size:
-            # Simple heuristic: font size proportional to smaller dimension
-            font_size = min(width, height) // 5
-            if font_size < 10:
-                font_size = 10  # Minimum size
-
-        # Construct SVG content
-        svg_content = f"""<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">"""
-        svg_content += f'<rect fill="{bg_color}" width="{width}" height="{height}"/>'
-
-        # Add text if provided
-        if text:
-            # Center text
-            text_x = width / 2
-            text_y = height / 2
-            svg_content += (
-                f'<text x="{text_x}" y="{text_y}" '
-                f'font-family="{font_family}" font-size="{font_size}" '
-                f'fill="{text_color}" text-anchor="middle" dy=".3em">'
-                f"{text}"
-                f"</text>"
-            )
-
-        svg_content += "</svg>"
-
-        # Create Data URI
-        svg_data_uri = f"data:image/svg+xml;base64,{base64.b64encode(svg_content.encode('utf-8')).decode('utf-8')}"
+        svg_content = build_svg(input_data)
+
+        # Create Data URI (base64 output is pure ASCII) only when the caller wants it
+        svg_data_uri = ""
+        if input_data.include_data_uri:
+            svg_data_uri = f"data:image/svg+xml;base64,{base64.b64encode(svg_content.encode('utf-8')).decode('ascii')}"
 
         return SvgOutput(svg=svg_content, data_uri=svg_data_uri)
 
@@ -61,3 +74,34 @@ async def generate_svg_placeholder(input_data: SvgInput):
     except Exception as e:
         logger.error(f"Error generating SVG placeholder: {e}", exc_info=True)
         return SvgOutput(svg="", data_uri="", error=f"Failed to generate SVG: {str(e)}")
+
+
+@router.get(
+    "/raw",
+    response_class=Response,
+    responses={200: {"content": {"image/svg+xml": {}}, "description": "The SVG document itself."}},
+)
+async def get_svg_placeholder(
+    width: int = Query(..., description="Width of the SVG placeholder", ge=1),
+    height: int = Query(..., description="Height of the SVG placeholder", ge=1),
+    text: Optional[str] = Query(None, description="Optional text to display"),
+    bg_color: str = Query("#cccccc", description="Background color (hex)"),
+    text_color: str = Query("#969696", description="Text color (hex)"),
+    font_family: str = Query("sans-serif", description="Font family for text"),
+    font_size: Optional[int] = Query(None, description="Font size (auto-calculated if not provided)", ge=1),
+):
+    """Serve the placeholder as image/svg+xml for direct use in <img src>, with no JSON or Base64 wrapping."""
+    try:
+        input_data = SvgInput(
+            width=width,
+            height=height,
+            text=text,
+            bg_color=bg_color,
+            text_color=text_color,
+            font_family=font_family,
+            font_size=font_size,
+        )
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False, include_context=False))
+
+    return Response(content=build_svg(input_data).encode("utf-8"), media_type="image/svg+xml")
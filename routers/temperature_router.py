@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException, status
 
 from models.temperature_models import (
+    TemperatureBatchInput,
+    TemperatureBatchOutput,
     TemperatureInput,
     TemperatureOutput,
     TemperatureUnit,
@@ -8,48 +10,77 @@ from models.temperature_models import (
 
 router = APIRouter(prefix="/api/temperature", tags=["Temperature"])
 
+KELVIN_OFFSET = 273.15
+
+
+# Each unit's conversion to (celsius, fahrenheit, kelvin). The input unit is echoed exactly and the
+# others use the original formulas, so results round the same way as before (ties included).
+def _from_celsius(c: float) -> tuple[float, float, float]:
+    return c, (c * 9 / 5) + 32, c + KELVIN_OFFSET
+
+
+def _from_fahrenheit(f: float) -> tuple[float, float, float]:
+    c = (f - 32) * 5 / 9
+    return c, f, c + KELVIN_OFFSET
+
+
+def _from_kelvin(k: float) -> tuple[float, float, float]:
+    c = k - KELVIN_OFFSET
+    return c, (c * 9 / 5) + 32, k
+
+
+_CONVERTERS = {
+    TemperatureUnit.celsius: _from_celsius,
+    TemperatureUnit.fahrenheit: _from_fahrenheit,
+    TemperatureUnit.kelvin: _from_kelvin,
+}
+
+
+def _convert(val: float, unit: TemperatureUnit) -> TemperatureOutput:
+    """Convert one value to all three units."""
+    if unit == TemperatureUnit.kelvin and val < 0:
+        # Physical impossibility
+        return TemperatureOutput(
+            celsius=0,
+            fahrenheit=0,
+            kelvin=val,
+            error="Kelvin cannot be below absolute zero (0 K).",
+        )
+
+    converter = _CONVERTERS.get(unit)
+    if converter is None:
+        # Should be caught by Pydantic
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid temperature unit specified.",
+        )
+
+    c, f, k = converter(val)
+    # Round results for cleaner output (e.g., 2 decimal places)
+    return TemperatureOutput(celsius=round(c, 2), fahrenheit=round(f, 2), kelvin=round(k, 2))
+
 
 @router.post("/convert", response_model=TemperatureOutput)
 async def convert_temperature(payload: TemperatureInput):
     """Convert temperature between Celsius, Fahrenheit, and Kelvin."""
-    c, f, k = None, None, None
-    val = payload.value
-    unit = payload.unit
-
     try:
-        if unit == TemperatureUnit.celsius:
-            c = val
-            f = (c * 9 / 5) + 32
-            k = c + 273.15
-        elif unit == TemperatureUnit.fahrenheit:
-            f = val
-            c = (f - 32) * 5 / 9
-            k = c + 273.15
-        elif unit == TemperatureUnit.kelvin:
-            k = val
-            if k < 0:
-                # Physical impossibility
-                return TemperatureOutput(
-                    celsius=0,
-                    fahrenheit=0,
-                    kelvin=k,
-                    error="Kelvin cannot be below absolute zero (0 K).",
-                )
-            c = k - 273.15
-            f = (c * 9 / 5) + 32
-        else:
-            # Should be caught by Pydantic
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid temperature unit specified.",
-            )
-
-        # Round results for cleaner output (e.g., 2 decimal places)
-        return TemperatureOutput(celsius=round(c, 2), fahrenheit=round(f, 2), kelvin=round(k, 2))
-
+        return _convert(payload.value, payload.unit)
     except Exception as e:
         print(f"Error converting temperature: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during temperature conversion",
         )
+
+
+@router.post("/convert/batch", response_model=TemperatureBatchOutput)
+async def convert_temperature_batch(payload: TemperatureBatchInput):
+    """Convert many temperatures in one request; results are in input order."""
+    try:
+        return TemperatureBatchOutput(results=[_convert(item.value, item.unit) for item in payload.items])
+    except Exception as e:
+        print(f"Error converting temperature batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error during temperature conversion",
+        )
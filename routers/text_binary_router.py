@@ -3,42 +3,56 @@ from typing import Dict
 
 from fastapi import APIRouter, HTTPException, status
 
-from models.text_binary_models import TextBinaryInput, TextBinaryOutput
+from models.text_binary_models import (
+    TextBinaryBatchInput,
+    TextBinaryBatchOutput,
+    TextBinaryInput,
+    TextBinaryOutput,
+)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/text-binary", tags=["Text Binary Converter"])
 
+# 8-bit binary strings for every byte value
+_BIN_TABLE = tuple(format(i, "08b") for i in range(256))
+# Deletes binary digits; anything left over is invalid input
+_BITS_TRANS = str.maketrans("", "", "01")
+# Combined length of all item texts in one batch; larger batches are rejected with 413
+BATCH_MAX_TOTAL_LENGTH = 1_000_000
 
-@router.post("/", response_model=TextBinaryOutput)
-async def convert_text_binary(input_data: TextBinaryInput):
-    """Convert between text and binary representation."""
+
+def _convert(input_data: TextBinaryInput) -> TextBinaryOutput:
+    """Run one conversion; raises HTTPException or ValueError for bad input."""
     # Store original text before stripping
     original_text = input_data.text
-    try:
-        mode = input_data.mode.lower()
-        # Strip text for processing, but keep original for output
-        text = original_text.strip()
+    mode = input_data.mode.lower()
 
-        if not text:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Input text cannot be empty")
+    # Strip text for the emptiness check, but convert and return the original
+    if not original_text.strip():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Input text cannot be empty")
 
-        if mode == "text_to_binary":
-            result, char_map = text_to_binary(
-                original_text, include_spaces=input_data.include_spaces, space_replacement=input_data.space_replacement
-            )
-        elif mode == "binary_to_text":
-            result, char_map = binary_to_text(original_text)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid conversion mode. Use 'text_to_binary' or 'binary_to_text'",
-            )
+    if mode == "text_to_binary":
+        result, char_map = text_to_binary(
+            original_text, include_spaces=input_data.include_spaces, space_replacement=input_data.space_replacement
+        )
+    elif mode == "binary_to_text":
+        result, char_map = binary_to_text(original_text)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid conversion mode. Use 'text_to_binary' or 'binary_to_text'",
+        )
+
+    # Return original_text, not the stripped version
+    return TextBinaryOutput(original=original_text, result=result, mode=mode, char_mapping=char_map)
 
-        # Return original_text, not the stripped version
-        return TextBinaryOutput(original=original_text, result=result, mode=mode, char_mapping=char_map)
+
+@router.post("/", response_model=TextBinaryOutput)
+async def convert_text_binary(input_data: TextBinaryInput):
+    """Convert between text and binary representation."""
+    try:
+        return _convert(input_data)
 
     except HTTPException as http_exc:  # Re-raise specific HTTPExceptions
         raise http_exc
@@ -51,18 +65,45 @@ async def convert_text_binary(input_data: TextBinaryInput):
         )
 
 
+@router.post("/batch", response_model=TextBinaryBatchOutput)
+async def convert_text_binary_batch(input_data: TextBinaryBatchInput):
+    """Run many text/binary conversions in one request; results are in input order.
+
+    The whole batch is rejected with 400 if any item is invalid, naming the item's index.
+    """
+    if sum(len(item.text) for item in input_data.items) > BATCH_MAX_TOTAL_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch too large: the item texts may total at most {BATCH_MAX_TOTAL_LENGTH} characters.",
+        )
+
+    results = []
+    for index, item in enumerate(input_data.items):
+        try:
+            results.append(_convert(item))
+        except HTTPException as http_exc:
+            raise HTTPException(status_code=http_exc.status_code, detail=f"Item {index}: {http_exc.detail}")
+        except ValueError as ve:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Item {index}: {ve}")
+        except Exception as e:
+            logger.error(f"Error converting between text and binary (item {index}): {e}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred: {str(e)}"
+            )
+    return TextBinaryBatchOutput(results=results)
+
+
 def text_to_binary(
     text: str, include_spaces: bool = True, space_replacement: str = "00100000"
 ) -> tuple[str, Dict[str, str]]:
     """Convert text to binary representation."""
-    binary_values = []
-    char_map = {}
-
-    for char in text:
-        # Get ASCII value then convert to binary, removing '0b' prefix
-        binary = bin(ord(char))[2:].zfill(8)
-        binary_values.append(binary)
-        char_map[char] = binary
+    try:
+        # Latin-1 covers code points 0-255, so each byte indexes the table directly
+        binary_values = [_BIN_TABLE[byte] for byte in text.encode("latin-1")]
+    except UnicodeEncodeError:
+        # Wider code points need more than 8 bits: format per character, table for the rest
+        binary_values = [_BIN_TABLE[code] if code < 256 else format(code, "b") for code in map(ord, text)]
+    char_map = dict(zip(text, binary_values))
 
     # Join with or without spaces
     result = " ".join(binary_values) if include_spaces else "".join(binary_values)
@@ -75,24 +116,19 @@ def binary_to_text(binary: str) -> tuple[str, Dict[str, str]]:
     clean_binary = binary.replace(" ", "")
 
     # Check if the binary string is valid
-    if not all(bit in "01" for bit in clean_binary):
+    if clean_binary.translate(_BITS_TRANS):
         raise ValueError("Invalid binary input. Only 0s, 1s, and spaces are allowed")
 
     # Check if the length is a multiple of 8
     if len(clean_binary) % 8 != 0:
         raise ValueError(f"Binary length must be a multiple of 8. Current length: {len(clean_binary)}")
 
-    # Convert 8-bit chunks to characters
-    result = ""
-    char_map = {}
+    if not clean_binary:
+        return "", {}
 
-    for i in range(0, len(clean_binary), 8):
-        chunk = clean_binary[i : i + 8]
-        try:
-            char = chr(int(chunk, 2))
-            result += char
-            char_map[chunk] = char
-        except ValueError:
-            raise ValueError(f"Invalid binary chunk: {chunk}")
+    # Parse all bits at once; every 8-bit chunk is one byte, i.e. one Latin-1 character
+    raw = int(clean_binary, 2).to_bytes(len(clean_binary) // 8, "big")
+    result = raw.decode("latin-1")
+    char_map = {_BIN_TABLE[byte]: chr(byte) for byte in dict.fromkeys(raw)}
 
     return result, char_map
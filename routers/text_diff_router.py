@@ -1,59 +1,211 @@
 import difflib
+import functools
+import html
 import logging
+from typing import Iterator, List, Optional
 
 from fastapi import APIRouter, HTTPException, status
 
 from models.text_diff_models import DiffFormat, TextDiffInput, TextDiffOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/text-diff", tags=["Text Diff"])
 
+# Above this many lines (both texts combined) ndiff output skips the quadratic intraline "?" hints
+NDIFF_INTRALINE_MAX_LINES = 1000
 
-@router.post("/", response_model=TextDiffOutput)
-async def generate_text_diff(input_data: TextDiffInput):
-    """Compare two texts and show the differences."""
-    try:
-        text1 = input_data.text1
-        text2 = input_data.text2
-        output_format = input_data.output_format
+# Combined text length above which diffs are not cached, so the cache stays bounded in memory
+DIFF_CACHE_MAX_TEXT_LENGTH = 256_000
+# difflib compares every line of one text against the other; larger line products are rejected with 413
+DIFF_MAX_LINE_PAIRS = 10**8
+
+_NDIFF_PREFIX = {"equal": "  ", "delete": "- ", "insert": "+ "}
+
+HTML_DIFF_TABSIZE = 4
 
-        # Optionally ignore whitespace
-        if input_data.ignore_whitespace:
-            lines1 = [line.strip() for line in text1.splitlines()]
-            lines2 = [line.strip() for line in text2.splitlines()]
+# Same table skeleton and CSS classes as difflib.HtmlDiff.make_table (diff, diff_header, diff_next,
+# diff_add, diff_chg, diff_sub), so existing HtmlDiff stylesheets keep working
+_HTML_TABLE_OPEN = '<table class="diff" cellspacing="0" cellpadding="0" rules="groups">' + "<colgroup></colgroup>" * 6
+_HTML_TABLE_CLOSE = "</table>"
+_HTML_NO_DIFFERENCES = (
+    '<tbody><tr><td class="diff_next"></td><td></td><td>&nbsp;No Differences Found&nbsp;</td>'
+    '<td class="diff_next"></td><td></td><td>&nbsp;No Differences Found&nbsp;</td></tr></tbody>'
+)
+
+
+def _plain_ndiff(lines1: List[str], lines2: List[str]) -> Iterator[str]:
+    """ndiff-style lines straight from SequenceMatcher opcodes, without intraline hints.
+
+    Matches difflib.ndiff except that replaced blocks are dumped as whole deletions and
+    insertions (smaller block first, like Differ's plain replace) instead of being paired
+    up line by line, which is what makes ndiff O(N*M).
+    """
+    matcher = difflib.SequenceMatcher(None, lines1, lines2)
+    for tag, alo, ahi, blo, bhi in matcher.get_opcodes():
+        if tag == "replace":
+            deleted = ("- " + line for line in lines1[alo:ahi])
+            inserted = ("+ " + line for line in lines2[blo:bhi])
+            if bhi - blo < ahi - alo:
+                yield from inserted
+                yield from deleted
+            else:
+                yield from deleted
+                yield from inserted
+        elif tag == "insert":
+            yield from (_NDIFF_PREFIX[tag] + line for line in lines2[blo:bhi])
         else:
-            lines1 = text1.splitlines()
-            lines2 = text2.splitlines()
-
-        # Generate diff based on format
-        if output_format == DiffFormat.HTML:
-            d = difflib.HtmlDiff(tabsize=4, wrapcolumn=80)
-            diff = d.make_table(lines1, lines2, context=True, numlines=input_data.context_lines)
-        elif output_format == DiffFormat.NDIFF:
-            diff_lines = list(difflib.ndiff(lines1, lines2))
-            diff = "\n".join(diff_lines)
-        elif output_format == DiffFormat.UNIFIED:
-            diff_lines = list(
-                difflib.unified_diff(
-                    lines1,
-                    lines2,
-                    fromfile="text1",
-                    tofile="text2",
-                    n=input_data.context_lines,
+            yield from (_NDIFF_PREFIX[tag] + line for line in lines1[alo:ahi])
+
+
+def _html_text(text: str) -> str:
+    """Escape text for a diff cell, keeping runs of spaces visible."""
+    return html.escape(text, quote=False).replace(" ", "&nbsp;")
+
+
+def _html_span(text: str, css_class: str) -> str:
+    return f'<span class="{css_class}">{_html_text(text)}</span>' if text else ""
+
+
+def _html_changed_pair(old: str, new: str) -> tuple[str, str]:
+    """Markup for a changed line pair: replaced runs as diff_chg, removed as diff_sub, added as diff_add."""
+    old_parts: List[str] = []
+    new_parts: List[str] = []
+    for tag, alo, ahi, blo, bhi in difflib.SequenceMatcher(None, old, new).get_opcodes():
+        if tag == "equal":
+            old_parts.append(_html_text(old[alo:ahi]))
+            new_parts.append(_html_text(new[blo:bhi]))
+        elif tag == "replace":
+            old_parts.append(_html_span(old[alo:ahi], "diff_chg"))
+            new_parts.append(_html_span(new[blo:bhi], "diff_chg"))
+        elif tag == "delete":
+            old_parts.append(_html_span(old[alo:ahi], "diff_sub"))
+        else:
+            new_parts.append(_html_span(new[blo:bhi], "diff_add"))
+    return "".join(old_parts), "".join(new_parts)
+
+
+def _html_side(side: str, line_no: Optional[int], markup: str) -> str:
+    if line_no is None:
+        return '<td class="diff_next"></td><td class="diff_header"></td><td nowrap="nowrap"></td>'
+    return (
+        f'<td class="diff_next"></td><td class="diff_header" id="{side}_{line_no}">{line_no}</td>'
+        f'<td nowrap="nowrap">{markup}</td>'
+    )
+
+
+def _html_diff_table(lines1: List[str], lines2: List[str], context_lines: int) -> str:
+    """Side-by-side HTML diff table built in one pass over SequenceMatcher's grouped opcodes.
+
+    Replaces difflib.HtmlDiff.make_table, whose line pairing goes through ndiff's O(N*M)
+    fancy replace. Replaced blocks are paired line by line in order; only those pairs get
+    intraline highlighting. Lines are not wrapped and no navigation links are emitted.
+    """
+    lines1 = [line.expandtabs(HTML_DIFF_TABSIZE) for line in lines1]
+    lines2 = [line.expandtabs(HTML_DIFF_TABSIZE) for line in lines2]
+    matcher = difflib.SequenceMatcher(None, lines1, lines2)
+
+    parts = [_HTML_TABLE_OPEN]
+    for group in matcher.get_grouped_opcodes(context_lines):
+        parts.append("<tbody>")
+        for tag, alo, ahi, blo, bhi in group:
+            if tag == "equal":
+                rows = (
+                    (i + 1, _html_text(lines1[i]), j + 1, _html_text(lines2[j]))
+                    for i, j in zip(range(alo, ahi), range(blo, bhi))
                 )
-            )
-            diff = "\n".join(diff_lines)
+            else:
+                rows = []
+                paired = min(ahi - alo, bhi - blo) if tag == "replace" else 0
+                for offset in range(paired):
+                    old_markup, new_markup = _html_changed_pair(lines1[alo + offset], lines2[blo + offset])
+                    rows.append((alo + offset + 1, old_markup, blo + offset + 1, new_markup))
+                rows.extend((i + 1, _html_span(lines1[i], "diff_sub"), None, "") for i in range(alo + paired, ahi))
+                rows.extend((None, "", j + 1, _html_span(lines2[j], "diff_add")) for j in range(blo + paired, bhi))
+            for from_no, from_markup, to_no, to_markup in rows:
+                parts.append(f"<tr>{_html_side('from', from_no, from_markup)}{_html_side('to', to_no, to_markup)}</tr>")
+        parts.append("</tbody>")
+
+    if len(parts) == 1:
+        parts.append(_HTML_NO_DIFFERENCES)
+    parts.append(_HTML_TABLE_CLOSE)
+    return "".join(parts)
+
+
+def _compute_diff(lines1: List[str], lines2: List[str], output_format: DiffFormat, context_lines: int) -> str:
+    """Render the diff of two line lists in the requested format."""
+    # Generate diff based on format
+    if output_format == DiffFormat.HTML:
+        diff = _html_diff_table(lines1, lines2, context_lines)
+    elif output_format == DiffFormat.NDIFF:
+        if len(lines1) + len(lines2) > NDIFF_INTRALINE_MAX_LINES:
+            diff = "\n".join(_plain_ndiff(lines1, lines2))
         else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid output format. Choose 'html', 'ndiff', or 'unified'",
+            diff_lines = list(difflib.ndiff(lines1, lines2))
+            diff = "\n".join(diff_lines)
+    elif output_format == DiffFormat.UNIFIED:
+        diff_lines = list(
+            difflib.unified_diff(
+                lines1,
+                lines2,
+                fromfile="text1",
+                tofile="text2",
+                n=context_lines,
             )
+        )
+        diff = "\n".join(diff_lines)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid output format. Choose 'html', 'ndiff', or 'unified'",
+        )
+
+    return diff
+
+
+def _diff_texts(text1: str, text2: str, output_format: DiffFormat, context_lines: int, ignore_whitespace: bool) -> str:
+    """Split both texts into lines (optionally ignoring surrounding whitespace) and diff them."""
+    if ignore_whitespace:
+        lines1 = [line.strip() for line in text1.splitlines()]
+        lines2 = [line.strip() for line in text2.splitlines()]
+    else:
+        lines1 = text1.splitlines()
+        lines2 = text2.splitlines()
+    # Checked on the split lines themselves, so every line break splitlines() knows counts
+    if len(lines1) * len(lines2) > DIFF_MAX_LINE_PAIRS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Input too large for diff: the texts have too many lines to compare.",
+        )
+    return _compute_diff(lines1, lines2, output_format, context_lines)
+
+
+# Diffs are deterministic per input; the texts themselves are the cache key
+_diff_texts_cached = functools.lru_cache(maxsize=256)(_diff_texts)
+
+
+# Plain def: difflib is O(N*M) pure Python, so FastAPI runs this in its threadpool
+@router.post("/", response_model=TextDiffOutput)
+def generate_text_diff(input_data: TextDiffInput):
+    """Compare two texts and show the differences."""
+    try:
+        output_format = input_data.output_format
+        diff_args = (
+            input_data.text1,
+            input_data.text2,
+            output_format,
+            input_data.context_lines,
+            input_data.ignore_whitespace,
+        )
+        # Repeated comparisons are served from the cache; very large texts bypass it
+        use_cache = len(input_data.text1) + len(input_data.text2) <= DIFF_CACHE_MAX_TEXT_LENGTH
+
+        diff = (_diff_texts_cached if use_cache else _diff_texts)(*diff_args)
 
         return TextDiffOutput(diff=diff, format_used=output_format.value, error=None)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating text diff: {e}", exc_info=True)
         format_val_str = "unknown"
@@ -6,6 +6,13 @@ from models.text_stats_models import TextStatsInput, TextStatsOutput
 
 router = APIRouter(prefix="/api/text", tags=["Text"])
 
+# Sentence boundary: whitespace after . ? or ! that doesn't end an abbreviation (e.g., "i.e.", "Mr.")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=[.?!])\s")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+
+# Line boundaries recognized by str.splitlines() besides "\n"
+_OTHER_LINE_BREAKS = "\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
 
 @router.post("/stats", response_model=TextStatsOutput)
 async def calculate_text_stats(payload: TextStatsInput):
@@ -14,23 +21,25 @@ async def calculate_text_stats(payload: TextStatsInput):
         text = payload.text
 
         char_count = len(text)
-        char_count_no_spaces = len("".join(text.split()))  # More concise way
 
         words = text.split()
         word_count = len(words)
+        char_count_no_spaces = sum(map(len, words))  # Words are exactly the non-whitespace runs
 
-        lines = text.splitlines()
-        # Count non-empty lines if desired, or just total lines
-        line_count = len(lines)
+        # Count total lines without building the list when "\n" is the only line break in use
+        if any(line_break in text for line_break in _OTHER_LINE_BREAKS):
+            line_count = len(text.splitlines())
+        else:
+            line_count = text.count("\n") + (1 if text and not text.endswith("\n") else 0)
         # non_empty_line_count = len([line for line in lines if line.strip()])
 
         # Improved Sentence count using lookahead for better splitting
-        sentences = re.split(r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s", text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         sentence_count = len([s for s in sentences if s.strip()])
         if sentence_count == 0 and len(text.strip()) > 0:
             sentence_count = 1
 
-        paragraphs = re.split(r"\n\s*\n", text)
+        paragraphs = _PARAGRAPH_SPLIT_RE.split(text)
         paragraph_count = len([p for p in paragraphs if p.strip()])
         if paragraph_count == 0 and len(text.strip()) > 0:
             paragraph_count = 1
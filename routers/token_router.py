@@ -16,6 +16,34 @@ CHARSET_MAP = {
 }
 
 
+def _byte_translation(charset: str) -> tuple[bytes, bytes]:
+    """Build a bytes.translate() table mapping random bytes onto `charset` without modulo bias.
+
+    Bytes below the largest multiple of len(charset) map to charset[byte % len(charset)];
+    the remaining bytes are returned separately so translate() can delete (reject) them.
+    """
+    size = len(charset)
+    limit = 256 - 256 % size
+    table = bytes(ord(charset[byte % size]) if byte < limit else 0 for byte in range(256))
+    return table, bytes(range(limit, 256))
+
+
+# (translation table, rejected bytes) per charset, built once
+_CHARSET_TRANSLATIONS = {charset_type: _byte_translation(charset) for charset_type, charset in CHARSET_MAP.items()}
+
+
+def _random_chars(charset_type: CharSetType, n: int) -> str:
+    """Draw `n` uniformly random characters from a charset with bulk CSPRNG reads."""
+    table, rejected = _CHARSET_TRANSLATIONS[charset_type]
+    accept_ratio = (256 - len(rejected)) / 256
+    chars = b""
+    while len(chars) < n:
+        missing = n - len(chars)
+        # Over-draw slightly so a single read almost always suffices after rejection
+        chars += secrets.token_bytes(int(missing / accept_ratio) + 16).translate(table, rejected)
+    return chars[:n].decode("ascii")
+
+
 @router.post("/generate", response_model=TokenOutput)
 async def generate_tokens(payload: TokenInput):
     """Generate random tokens with specified length, count, and character set."""
@@ -28,7 +56,9 @@ async def generate_tokens(payload: TokenInput):
         )
 
     try:
-        tokens = ["".join(secrets.choice(charset) for _ in range(payload.length)) for _ in range(payload.count)]
+        # One bulk draw for all tokens, then slice it up
+        chars = _random_chars(payload.charset_type, payload.length * payload.count)
+        tokens = [chars[i : i + payload.length] for i in range(0, len(chars), payload.length)]
         return TokenOutput(tokens=tokens)
     except Exception as e:
         print(f"Error generating tokens: {e}")
@@ -6,8 +6,6 @@ from ulid import from_timestamp, new
 
 from models.ulid_models import UlidResponse
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/ulid", tags=["ULID Generator"])
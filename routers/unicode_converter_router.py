@@ -1,10 +1,11 @@
+import functools
 import logging
+import re
+from typing import Optional
 
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/unicode-converter", tags=["Unicode Converter"])
@@ -13,7 +14,9 @@ router = APIRouter(prefix="/api/unicode-converter", tags=["Unicode Converter"])
 class UnicodeInput(BaseModel):
     text: str = Field(
         ...,
-        description="Text to convert to Unicode code points or Unicode code points to convert back to text.",
+        max_length=1_000_000,
+        description="Text to convert to Unicode code points or Unicode code points to convert back to text "
+        "(max 1,000,000 characters).",
     )
     prefix: str = Field(
         default="U+",
@@ -35,6 +38,10 @@ class UnicodeOutput(BaseModel):
     result: str = Field(..., description="The resulting Unicode code point string or decoded text.")
 
 
+# Builtin format specs for the common bases; hex is upper-case like int_to_base and padded to 4 digits (common convention)
+_FORMAT_SPECS = {2: "b", 8: "o", 10: "d", 16: "04X"}
+
+
 # Helper to convert integer to specified base
 def int_to_base(n, b):
     if n == 0:
@@ -47,27 +54,45 @@ def int_to_base(n, b):
     return "".join(str(i) if i < 10 else chr(ord("A") + i - 10) for i in digits[::-1])
 
 
+# Longer prefixes are formatted per character so cached token tables stay small
+ASCII_TOKENS_MAX_PREFIX_LENGTH = 16
+
+
+@functools.lru_cache(maxsize=64)
+def _ascii_tokens(prefix: str, base: int) -> tuple[str, ...]:
+    """Encoded token (prefix + digits) for each of the 128 ASCII code points."""
+    spec = _FORMAT_SPECS.get(base)
+    if spec is not None:
+        return tuple(f"{prefix}{code_point:{spec}}" for code_point in range(128))
+    return tuple(f"{prefix}{int_to_base(code_point, base)}" for code_point in range(128))
+
+
 @router.post(
     "/encode",
     response_model=UnicodeOutput,
     summary="Convert text to Unicode code points",
 )
-async def text_to_unicode(payload: UnicodeInput):
+def text_to_unicode(payload: UnicodeInput):
     """Converts each character of the input text to its Unicode code point representation."""
     try:
         if not payload.text:
             return UnicodeOutput(result="")
 
-        unicode_points = []
-        for char in payload.text:
-            code_point = ord(char)
-            formatted_point = int_to_base(code_point, payload.base)
-            # Add padding for hex if needed (common convention)
-            if payload.base == 16:
-                formatted_point = formatted_point.zfill(4)
-            unicode_points.append(f"{payload.prefix}{formatted_point}")
-
-        result = payload.separator.join(unicode_points)
+        prefix = payload.prefix
+        spec = _FORMAT_SPECS.get(payload.base)
+        if payload.text.isascii() and len(prefix) <= ASCII_TOKENS_MAX_PREFIX_LENGTH:
+            # ASCII text: the encoded bytes are the code points, and each maps to a pre-built token
+            tokens = _ascii_tokens(prefix, payload.base)
+            result = payload.separator.join([tokens[code_point] for code_point in payload.text.encode("ascii")])
+        else:
+            # Other text: format each distinct character once, then look its token up per character
+            distinct_chars = set(payload.text)
+            if spec is not None:
+                tokens = {char: f"{prefix}{ord(char):{spec}}" for char in distinct_chars}
+            else:
+                base = payload.base
+                tokens = {char: f"{prefix}{int_to_base(ord(char), base)}" for char in distinct_chars}
+            result = payload.separator.join([tokens[char] for char in payload.text])
         return UnicodeOutput(result=result)
     except Exception as e:
         logger.error(f"Error converting text to Unicode points: {e}", exc_info=True)
@@ -77,81 +102,90 @@ async def text_to_unicode(payload: UnicodeInput):
         )
 
 
+def _code_point_error(code_points_str: list[str], base: int) -> HTTPException:
+    """Build the 400 error for the first code point that cannot be decoded."""
+    for cp_str in code_points_str:
+        try:
+            chr(int(cp_str, base))
+        except ValueError:
+            logger.warning(f"Could not convert '{cp_str}' from base {base}.")
+            return HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid code point value '{cp_str}' for base {base}.",
+            )
+        except OverflowError:
+            logger.warning(f"Decoded integer {cp_str} (base {base}) is outside valid Unicode range.")
+            return HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Code point value '{cp_str}' is outside the valid Unicode range.",
+            )
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid code point values for base {base}.")
+
+
+# The default decode input: "U+" and exactly four hex digits per code point, space- or un-separated
+_U_PLUS_HEX4_RUNS = {
+    " ": re.compile(r"U\+[0-9A-Fa-f]{4}(?: U\+[0-9A-Fa-f]{4})*"),
+    "": re.compile(r"(?:U\+[0-9A-Fa-f]{4})+"),
+}
+
+
+def _decode_u_plus_hex4(text: str, separator: str) -> Optional[str]:
+    """Decode the default U+XXXX form in C (hex -> UTF-16 code units); None when the generic path is needed."""
+    pattern = _U_PLUS_HEX4_RUNS.get(separator)
+    if pattern is None or not pattern.fullmatch(text):
+        return None
+    decoded = bytes.fromhex(text.replace("U+", "")).decode("utf-16-be", errors="surrogatepass")
+    # A surrogate pair decodes to one astral character where chr() yields two code points; leave those to the generic path
+    token_count = (len(text) + len(separator)) // (6 + len(separator))
+    return decoded if len(decoded) == token_count else None
+
+
 @router.post(
     "/decode",
     response_model=UnicodeOutput,
     summary="Convert Unicode code points back to text",
 )
-async def unicode_to_text(payload: UnicodeInput):
+def unicode_to_text(payload: UnicodeInput):
     """Convert a string of Unicode code points back into text."""
     try:
         text = payload.text.strip()
         if not text:
             return UnicodeOutput(result="")
 
-        code_points_str = []
+        if payload.prefix == "U+" and payload.base == 16:
+            decoded = _decode_u_plus_hex4(text, payload.separator)
+            if decoded is not None:
+                return UnicodeOutput(result=decoded)
+
+        prefix = payload.prefix
         if payload.separator:
             # Split by separator if provided
-            code_points_str = text.split(payload.separator)
-        elif payload.prefix:
-            # Handle concatenated codes if prefix is known and separator is empty
-            current_pos = 0
-            while current_pos < len(text):
-                start_pos = text.find(payload.prefix, current_pos)
-                if start_pos == -1:
-                    break  # No more prefixes found
-                code_start = start_pos + len(payload.prefix)
-                next_prefix_pos = text.find(payload.prefix, code_start)
-                if next_prefix_pos == -1:
-                    code_points_str.append(text[start_pos:])  # Get the rest of the string
-                    break
-                else:
-                    code_points_str.append(text[start_pos:next_prefix_pos])
-                    current_pos = next_prefix_pos
+            tokens = text.split(payload.separator)
+            if prefix:
+                # Tokens without the expected prefix are skipped
+                prefix_len = len(prefix)
+                code_points_str = [token[prefix_len:] for token in tokens if token.startswith(prefix)]
+                skipped = len(tokens) - len(code_points_str) - tokens.count("")
+                if skipped:
+                    logger.debug(f"Skipped {skipped} code point(s) without the expected prefix '{prefix}'.")
+            else:
+                code_points_str = tokens
+        elif prefix:
+            # Handle concatenated codes if prefix is known and separator is empty: one split on the
+            # prefix both tokenizes and strips it; anything before the first prefix is dropped
+            code_points_str = text.split(prefix)[1:]
         else:
             # No separator and no prefix - assume single code point? Or treat as error?
             # For now, assume single code point for backward compatibility/simplicity
             code_points_str = [text]
 
-        decoded_chars = []
-        for cp_str in code_points_str:
-            if not cp_str:
-                continue
-
-            # Remove prefix if present
-            processed_cp_str = cp_str
-            if payload.prefix and cp_str.startswith(payload.prefix):
-                processed_cp_str = cp_str[len(payload.prefix) :]
-            elif payload.prefix:
-                # If prefix is expected but not found, treat as error or skip?
-                logger.debug(f"Expected prefix '{payload.prefix}' not found in '{cp_str}', skipping.")
-                # Alternatively, raise error: raise HTTPException(...) or append '?'
-                continue
-
-            if not processed_cp_str:
-                logger.debug(f"Empty code point string after removing prefix from '{cp_str}', skipping.")
-                continue
-
-            try:
-                # Convert from specified base
-                code_point_int = int(processed_cp_str, payload.base)
-                decoded_chars.append(chr(code_point_int))
-            except ValueError:
-                logger.warning(f"Could not convert '{processed_cp_str}' from base {payload.base}. Original: '{cp_str}'")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid code point value '{processed_cp_str}' for base {payload.base}.",
-                )
-            except OverflowError:
-                logger.warning(
-                    f"Decoded integer {processed_cp_str} (base {payload.base}) is outside valid Unicode range."
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Code point value '{processed_cp_str}' is outside the valid Unicode range.",
-                )
-
-        result = "".join(decoded_chars)
+        # Empty tokens (doubled separators, bare prefixes) are skipped
+        code_points_str = [cp_str for cp_str in code_points_str if cp_str]
+        base = payload.base
+        try:
+            result = "".join([chr(int(cp_str, base)) for cp_str in code_points_str])
+        except (ValueError, OverflowError):
+            raise _code_point_error(code_points_str, base)
         return UnicodeOutput(result=result)
 
     except HTTPException as http_exc:
@@ -1,19 +1,32 @@
 import logging
-from urllib.parse import quote, unquote
+import string
+from urllib.parse import unquote
 
 from fastapi import APIRouter, HTTPException, status
 
 from models.url_encoder_models import UrlEncoderInput, UrlEncoderOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/url-encoder", tags=["URL Encoder"])
 
+# RFC 3986 unreserved characters: the only bytes quote(text, safe="") leaves as is
+_UNRESERVED_BYTES = (string.ascii_letters + string.digits + "-._~").encode("ascii")
+# Encoded form of every byte value, so encoding is one list lookup per UTF-8 byte
+_ENCODE_TABLE = [chr(b) if b in _UNRESERVED_BYTES else f"%{b:02X}" for b in range(256)]
+
+
+def _percent_encode(text: str) -> str:
+    """Percent-encode every byte except unreserved characters; same output as quote(text, safe="")."""
+    raw = text.encode("utf-8")
+    if not raw.translate(None, _UNRESERVED_BYTES):
+        return text
+    table = _ENCODE_TABLE
+    return "".join([table[byte] for byte in raw])
+
 
 @router.post("/", response_model=UrlEncoderOutput)
-async def process_url_encoding(input_data: UrlEncoderInput):
+def process_url_encoding(input_data: UrlEncoderInput):
     """Encode or decode URLs and URL components."""
     try:
         text = input_data.text.strip()
@@ -23,7 +36,7 @@ async def process_url_encoding(input_data: UrlEncoderInput):
         mode = input_data.mode.lower()
 
         if mode == "encode":
-            result = quote(text, safe="")
+            result = _percent_encode(text)
         elif mode == "decode":
             try:
                 # Specify encoding and error handling for robustness
@@ -1,3 +1,4 @@
+import functools
 import logging
 
 from fastapi import APIRouter, HTTPException, status
@@ -5,65 +6,82 @@ from user_agents import parse
 
 from models.user_agent_parser_models import UserAgentInput, UserAgentOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/user-agent-parser", tags=["User Agent Parser"])
 
 
+# Longer strings are parsed directly so the cache never pins oversized headers
+USER_AGENT_CACHE_MAX_LENGTH = 2048
+
+
+def _describe_user_agent(user_agent_string: str) -> tuple[dict, dict, dict]:
+    """Parse a User-Agent string into browser, OS and device dicts."""
+    # Parse the user agent
+    parsed_ua = parse(user_agent_string)
+
+    # Extract browser info with defaults for missing values
+    browser = {
+        "family": parsed_ua.browser.family or "Unknown",
+        "version": parsed_ua.browser.version_string or "",
+        "version_major": str(parsed_ua.browser.version[0]) if parsed_ua.browser.version else "",
+        "version_minor": (
+            str(parsed_ua.browser.version[1])
+            if parsed_ua.browser.version and len(parsed_ua.browser.version) > 1
+            else ""
+        ),
+        "version_patch": (
+            str(parsed_ua.browser.version[2])
+            if parsed_ua.browser.version and len(parsed_ua.browser.version) > 2
+            else ""
+        ),
+    }
+
+    # Extract OS info with defaults for missing values
+    os = {
+        "family": parsed_ua.os.family or "Unknown",
+        "version": parsed_ua.os.version_string or "",
+        "version_major": str(parsed_ua.os.version[0]) if parsed_ua.os.version else "",
+        "version_minor": (
+            str(parsed_ua.os.version[1]) if parsed_ua.os.version and len(parsed_ua.os.version) > 1 else ""
+        ),
+        "version_patch": (
+            str(parsed_ua.os.version[2]) if parsed_ua.os.version and len(parsed_ua.os.version) > 2 else ""
+        ),
+    }
+
+    # Extract device info with defaults and correct boolean types
+    device = {
+        "family": parsed_ua.device.family or "Unknown",
+        "brand": parsed_ua.device.brand or "",
+        "model": parsed_ua.device.model or "",
+        "is_mobile": parsed_ua.is_mobile,
+        "is_tablet": parsed_ua.is_tablet,
+        "is_pc": parsed_ua.is_pc,
+        "is_bot": parsed_ua.is_bot,
+        "is_touch_capable": parsed_ua.is_touch_capable,
+    }
+
+    return browser, os, device
+
+
+# ua-parser runs its regex rule list on every parse; real traffic repeats the same few User-Agents
+_describe_user_agent_cached = functools.lru_cache(maxsize=4096)(_describe_user_agent)
+
+
 @router.post("/", response_model=UserAgentOutput)
-async def parse_user_agent(input_data: UserAgentInput):
+def parse_user_agent(input_data: UserAgentInput):
     """Parse a User-Agent string to extract browser, OS, and device information."""
     try:
         user_agent_string = input_data.user_agent.strip()
         if not user_agent_string:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User-Agent string cannot be empty")
 
-        # Parse the user agent
-        parsed_ua = parse(user_agent_string)
-
-        # Extract browser info with defaults for missing values
-        browser = {
-            "family": parsed_ua.browser.family or "Unknown",
-            "version": parsed_ua.browser.version_string or "",
-            "version_major": str(parsed_ua.browser.version[0]) if parsed_ua.browser.version else "",
-            "version_minor": (
-                str(parsed_ua.browser.version[1])
-                if parsed_ua.browser.version and len(parsed_ua.browser.version) > 1
-                else ""
-            ),
-            "version_patch": (
-                str(parsed_ua.browser.version[2])
-                if parsed_ua.browser.version and len(parsed_ua.browser.version) > 2
-                else ""
-            ),
-        }
-
-        # Extract OS info with defaults for missing values
-        os = {
-            "family": parsed_ua.os.family or "Unknown",
-            "version": parsed_ua.os.version_string or "",
-            "version_major": str(parsed_ua.os.version[0]) if parsed_ua.os.version else "",
-            "version_minor": (
-                str(parsed_ua.os.version[1]) if parsed_ua.os.version and len(parsed_ua.os.version) > 1 else ""
-            ),
-            "version_patch": (
-                str(parsed_ua.os.version[2]) if parsed_ua.os.version and len(parsed_ua.os.version) > 2 else ""
-            ),
-        }
-
-        # Extract device info with defaults and correct boolean types
-        device = {
-            "family": parsed_ua.device.family or "Unknown",
-            "brand": parsed_ua.device.brand or "",
-            "model": parsed_ua.device.model or "",
-            "is_mobile": parsed_ua.is_mobile,
-            "is_tablet": parsed_ua.is_tablet,
-            "is_pc": parsed_ua.is_pc,
-            "is_bot": parsed_ua.is_bot,
-            "is_touch_capable": parsed_ua.is_touch_capable,
-        }
+        # Repeated User-Agents are served from the cache; the output model copies the dicts
+        if len(user_agent_string) <= USER_AGENT_CACHE_MAX_LENGTH:
+            browser, os, device = _describe_user_agent_cached(user_agent_string)
+        else:
+            browser, os, device = _describe_user_agent(user_agent_string)
 
         return UserAgentOutput(browser=browser, os=os, device=device, raw_user_agent=user_agent_string)
 
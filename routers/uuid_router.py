@@ -13,9 +13,7 @@ router = APIRouter(prefix="/api/uuid", tags=["UUID Generator"])
 
 
 @router.get("/", response_model=UuidResponse)
-async def get_uuid_details_endpoint(
-    version: int = Query(4, description="UUID version to generate (1 or 4)", ge=1, le=4)
-):
+def get_uuid_details_endpoint(version: int = Query(4, description="UUID version to generate (1 or 4)", ge=1, le=4)):
     """Generate a UUID of the specified version (1 or 4) with detailed info."""
     # Restore explicit check for supported versions for this specific GET endpoint
     if version not in [1, 4]:
@@ -54,7 +52,7 @@ async def get_uuid_details_endpoint(
 
 
 @router.post("/v{version}", response_model=UuidOutput)
-async def generate_uuid_post_endpoint(version: int = Path(..., ge=1, le=5), payload: Optional[UuidInput] = None):
+def generate_uuid_post_endpoint(version: int = Path(..., ge=1, le=5), payload: Optional[UuidInput] = None):
     """Generate a UUID of the specified version (1, 3, 4, or 5)."""
     try:
         # Prepare args for the tool
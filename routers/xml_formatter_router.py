@@ -1,4 +1,7 @@
+import codecs
+import io
 import logging
+import threading
 import xml.dom.minidom
 import xml.etree.ElementTree as ET
 from xml.parsers.expat import ExpatError
@@ -7,53 +10,109 @@ from fastapi import APIRouter, HTTPException, status
 
 from models.xml_formatter_models import XmlInput, XmlOutput
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    from lxml import etree as LET
+except ImportError:  # Optional dependency: pip install lxml
+    LET = None
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/xml-formatter", tags=["XML Formatter"])
 
+# Invalid XML from either parser is reported in the response, not raised
+_XML_PARSE_ERRORS = (ExpatError, ET.ParseError) if LET is None else (ExpatError, ET.ParseError, LET.XMLSyntaxError)
+
+
+# libxml2 parsers are reusable but not thread-safe; format_xml runs on FastAPI's threadpool, so keep one per thread
+_lxml_parsers = threading.local()
+
+
+def _lxml_parser() -> "LET.XMLParser":
+    """This thread's libxml2 parser, configured to read documents the way ElementTree does.
+
+    Input is always handed over as UTF-8 (like ET.fromstring(str)), only internal entities are
+    expanded, nothing is fetched from the network, and comments and processing instructions
+    are dropped because ElementTree's default tree builder drops them too.
+    """
+    parser = getattr(_lxml_parsers, "parser", None)
+    if parser is None:
+        parser = _lxml_parsers.parser = LET.XMLParser(
+            encoding="utf-8",
+            resolve_entities="internal",
+            no_network=True,
+            remove_comments=True,
+            remove_pis=True,
+        )
+    return parser
+
+
+def _indent_and_serialize(xml_str: str, indent: str, encoding: str, xml_declaration: bool) -> str:
+    """Re-indent an XML document with libxml2 when lxml is installed, otherwise with ElementTree.
+
+    Both produce the same element tree, but ElementTree renames namespace prefixes to ns0, ns1, ...
+    and writes empty elements as <b />, where lxml keeps the original prefixes and writes <b/>.
+    """
+    if LET is not None:
+        root = LET.fromstring(xml_str.encode("utf-8"), parser=_lxml_parser())
+        LET.indent(root, space=indent)
+        return LET.tostring(root, encoding=encoding, xml_declaration=xml_declaration).decode(encoding)
+
+    root = ET.fromstring(xml_str)
+    ET.indent(root, space=indent)
+    return ET.tostring(root, encoding=encoding, xml_declaration=xml_declaration).decode(encoding)
 
+
+def _minidom_pretty(xml_str: str, indent: str, encoding: str, omit_declaration: bool) -> str:
+    """Pretty-print with minidom, writing straight into the result string.
+
+    Same output as dom.toprettyxml(indent, encoding=encoding).decode(encoding) with the declaration
+    line optionally stripped, without the intermediate bytes. Encodings other than UTF-8 still
+    go through bytes so unrepresentable characters become character references.
+    """
+    dom = xml.dom.minidom.parseString(xml_str)
+    utf8 = codecs.lookup(encoding).name == "utf-8"
+    if utf8:
+        writer = io.StringIO()
+    else:
+        writer = io.TextIOWrapper(io.BytesIO(), encoding=encoding, errors="xmlcharrefreplace", newline="\n")
+
+    if omit_declaration:
+        # Document.writexml minus the XML declaration
+        for node in dom.childNodes:
+            node.writexml(writer, "", indent, "\n")
+    else:
+        dom.writexml(writer, "", indent, "\n", encoding)
+
+    return writer.getvalue() if utf8 else writer.detach().getvalue().decode(encoding)
+
+
+def _format_document(xml_str: str, input_data: XmlInput) -> str:
+    """Format XML using minidom or ElementTree based on settings."""
+    if input_data.preserve_whitespace:
+        # Use minidom to preserve whitespace
+        return _minidom_pretty(
+            xml_str, input_data.indent, input_data.encoding, omit_declaration=input_data.omit_declaration
+        )
+    # Use ElementTree-style indentation for better formatting control (libxml2 when available)
+    return _indent_and_serialize(
+        xml_str, input_data.indent, input_data.encoding, xml_declaration=not input_data.omit_declaration
+    )
+
+
+# Plain def: parsing and serializing large documents is CPU-bound, so FastAPI runs it in its threadpool
 @router.post("/", response_model=XmlOutput)
-async def format_xml(input_data: XmlInput):
+def format_xml(input_data: XmlInput):
     """Format/prettify XML with custom indentation."""
     try:
         xml_str = input_data.xml.strip()
         if not xml_str:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="XML string cannot be empty")
 
-        # Format XML using minidom or ElementTree based on settings
         try:
-            if input_data.preserve_whitespace:
-                # Use minidom to preserve whitespace
-                dom = xml.dom.minidom.parseString(xml_str)
-                formatted_bytes = dom.toprettyxml(indent=input_data.indent, encoding=input_data.encoding)
-                formatted = formatted_bytes.decode(input_data.encoding)
-
-                # Optionally remove XML declaration
-                if input_data.omit_declaration:
-                    lines = formatted.split("\n")
-                    if lines and "<?xml" in lines[0]:
-                        formatted = "\n".join(lines[1:]).lstrip()
-            else:
-                # Use ElementTree for better formatting control
-                root = ET.fromstring(xml_str)
-                ET.indent(root, space=input_data.indent)
-
-                # Format with XML declaration
-                if not input_data.omit_declaration:
-                    formatted = ET.tostring(root, encoding=input_data.encoding, xml_declaration=True).decode(
-                        input_data.encoding
-                    )
-                else:
-                    # Format without XML declaration
-                    formatted = ET.tostring(root, encoding=input_data.encoding, xml_declaration=False).decode(
-                        input_data.encoding
-                    )
-
+            formatted = _format_document(xml_str, input_data)
             return XmlOutput(original=xml_str, formatted=formatted)
 
-        except (ExpatError, ET.ParseError) as xml_err:
+        except _XML_PARSE_ERRORS as xml_err:
             return XmlOutput(original=xml_str, formatted="", error=f"Invalid XML: {str(xml_err)}")
 
     except HTTPException as http_err:
@@ -6,17 +6,23 @@ import pytest
 
 from mcp_server.tools.case_converter import SUPPORTED_CASES, convert_case
 
+# Supported case names as the tool lists them in its error message
+SUPPORTED_CASES_TEXT = str(list(SUPPORTED_CASES.keys()))
+
+# Basic conversions of one phrase into every target, checked in a single test: (target_case, expected_output)
+BASIC_CONVERSIONS = [
+    ("camel", "helloWorld"),
+    ("snake", "hello_world"),
+    ("pascal", "HelloWorld"),
+    ("constant", "HELLO_WORLD"),
+    ("kebab", "hello-world"),
+    ("capital", "Hello World"),  # Note: caseconverter.titlecase
+    ("lower", "hello world"),
+    ("upper", "HELLO WORLD"),
+]
+
 # Test cases: (input_string, target_case, expected_output)
 TEST_CASES_SUCCESS = [
-    # Basic conversions
-    ("hello world", "camel", "helloWorld"),
-    ("hello world", "snake", "hello_world"),
-    ("hello world", "pascal", "HelloWorld"),
-    ("hello world", "constant", "HELLO_WORLD"),
-    ("hello world", "kebab", "hello-world"),
-    ("hello world", "capital", "Hello World"),  # Note: caseconverter.titlecase
-    ("hello world", "lower", "hello world"),
-    ("hello world", "upper", "HELLO WORLD"),
     # Mixed input case
     ("Hello World 123", "snake", "hello_world_123"),
     ("someHTTPRequest", "kebab", "some-httprequest"),
@@ -43,6 +49,14 @@ def test_convert_case_success(input_str: str, target: str, expected: str):
     assert result["result"] == expected
 
 
+def test_convert_case_basic_conversions():
+    """Test converting a plain two-word phrase into every supported target case."""
+    for target, expected in BASIC_CONVERSIONS:
+        result = convert_case(input_string="hello world", target_case=target)
+        assert result["error"] is None, f"Expected no error for 'hello world' -> '{target}', but got: {result['error']}"
+        assert result["result"] == expected, target
+
+
 @pytest.mark.parametrize("invalid_target_case", ["invalid", "dot", "sentence", " ", "UnknownCase"])
 def test_convert_case_invalid_target(invalid_target_case: str):
     """Test conversion failure with invalid target case names."""
@@ -52,7 +66,7 @@ def test_convert_case_invalid_target(invalid_target_case: str):
     assert "Invalid target_case" in result["error"]
     assert result["result"] == ""
     # Check that the error message lists the supported cases
-    assert str(list(SUPPORTED_CASES.keys())) in result["error"]
+    assert SUPPORTED_CASES_TEXT in result["error"]
 
 
 def test_convert_case_preserves_input_type():
@@ -9,13 +9,13 @@ from mcp_server.tools.chmod_calculator import calculate_numeric_chmod, calculate
 # Test cases for numeric calculation: (owner_perms, group_perms, other_perms, expected_numeric)
 # Perms format: (read, write, execute)
 TEST_CASES_NUMERIC = [
-    ((True, True, True), (True, True, True), (True, True, True), "777"),  # rwxrwxrwx
-    ((True, True, False), (True, False, True), (True, False, False), "654"),  # rw-r-xr--
-    ((True, False, False), (False, False, False), (False, False, False), "400"),  # r--------
-    ((False, True, False), (False, True, False), (False, True, False), "222"),  # -w--w--w-
-    ((False, False, True), (False, False, True), (False, False, True), "111"),  # --x--x--x
-    ((False, False, False), (False, False, False), (False, False, False), "000"),  # ---------
-    ((True, True, True), (False, False, False), (False, False, False), "700"),  # rwx------
+    pytest.param((True, True, True), (True, True, True), (True, True, True), "777", id="777-rwxrwxrwx"),
+    pytest.param((True, True, False), (True, False, True), (True, False, False), "654", id="654-rw-r-xr--"),
+    pytest.param((True, False, False), (False, False, False), (False, False, False), "400", id="400-r--------"),
+    pytest.param((False, True, False), (False, True, False), (False, True, False), "222", id="222--w--w--w-"),
+    pytest.param((False, False, True), (False, False, True), (False, False, True), "111", id="111---x--x--x"),
+    pytest.param((False, False, False), (False, False, False), (False, False, False), "000", id="000---------"),
+    pytest.param((True, True, True), (False, False, False), (False, False, False), "700", id="700-rwx------"),
 ]
 
 
@@ -39,17 +39,17 @@ def test_calculate_numeric_chmod_success(owner, group, others, expected):
 
 # Test cases for symbolic calculation: (input_numeric, expected_symbolic)
 TEST_CASES_SYMBOLIC = [
-    ("777", "rwxrwxrwx"),
-    ("654", "rw-r-xr--"),
-    ("400", "r--------"),
-    ("222", "-w--w--w-"),
-    ("111", "--x--x--x"),
-    ("000", "---------"),
-    ("700", "rwx------"),
-    ("0755", "rwxr-xr-x"),  # Test with leading zero
-    (" 755 ", "rwxr-xr-x"),  # Test with whitespace
-    ("5", "------r-x"),  # Test single digit expansion (applies to others)
-    ("0", "---------"),  # Test single digit 0 expansion
+    pytest.param("777", "rwxrwxrwx", id="777"),
+    pytest.param("654", "rw-r-xr--", id="654"),
+    pytest.param("400", "r--------", id="400"),
+    pytest.param("222", "-w--w--w-", id="222"),
+    pytest.param("111", "--x--x--x", id="111"),
+    pytest.param("000", "---------", id="000"),
+    pytest.param("700", "rwx------", id="700"),
+    pytest.param("0755", "rwxr-xr-x", id="0755"),  # Test with leading zero
+    pytest.param(" 755 ", "rwxr-xr-x", id="755-padded"),  # Test with whitespace
+    pytest.param("5", "------r-x", id="5"),  # Test single digit expansion (applies to others)
+    pytest.param("0", "---------", id="0"),  # Test single digit 0 expansion
 ]
 
 
@@ -61,6 +61,40 @@ def test_calculate_symbolic_chmod_success(numeric_input, expected_symbolic):
     assert result["symbolic_chmod"] == expected_symbolic
 
 
+# Independent oracle for symbolic output: one triplet per octal digit
+SYMBOLIC_TRIPLETS = ("---", "--x", "-w-", "-wx", "r--", "r-x", "rw-", "rwx")
+
+
+def test_calculate_symbolic_chmod_all_modes():
+    """Every mode from 000 to 777 should match the triplet-table oracle."""
+    for mode in range(0o1000):
+        numeric_input = f"{mode:03o}"
+        expected = "".join(SYMBOLIC_TRIPLETS[int(digit)] for digit in numeric_input)
+        result = calculate_symbolic_chmod(numeric_chmod_string=numeric_input)
+        assert result["error"] is None, f"Expected no error for input '{numeric_input}', but got: {result['error']}"
+        assert result["symbolic_chmod"] == expected, numeric_input
+
+
+def symbolic_to_flags(symbolic: str) -> dict[str, bool]:
+    """Map a 9-character rwx string onto calculate_numeric_chmod's keyword flags."""
+    flags = {}
+    for offset, who in enumerate(("owner", "group", "others")):
+        triplet = symbolic[offset * 3 : offset * 3 + 3]
+        for char, perm in zip(triplet, ("read", "write", "execute")):
+            flags[f"{who}_{perm}"] = char != "-"
+    return flags
+
+
+def test_chmod_roundtrip_all_modes():
+    """Numeric -> symbolic -> numeric should reproduce every mode from 000 to 777."""
+    for mode in range(0o1000):
+        numeric_input = f"{mode:03o}"
+        symbolic = calculate_symbolic_chmod(numeric_chmod_string=numeric_input)["symbolic_chmod"]
+        result = calculate_numeric_chmod(**symbolic_to_flags(symbolic))
+        assert result["error"] is None, f"Expected no error for '{symbolic}', but got: {result['error']}"
+        assert result["numeric_chmod"] == numeric_input, symbolic
+
+
 # Test cases for symbolic calculation errors: (input_numeric, expected_error_part)
 TEST_CASES_SYMBOLIC_ERROR = [
     ("", "Numeric value must resolve to 3 digits"),  # Empty string
@@ -2,6 +2,8 @@
 Tests for the Color Converter tool.
 """
 
+from ast import literal_eval
+
 import pytest
 from colour import Color
 
@@ -13,7 +15,21 @@ def approx_equal(a, b, tol=1e-6):
     return abs(a - b) < tol
 
 
-# Test cases: (input_color, target_format, expected_result_or_type, check_parsed_vals)
+def assert_parsed(result, input_color, target_format, parsed_vals):
+    """Check the fields every successful conversion reports, whatever the target format."""
+    expected_hex, expected_rgb, expected_hsl = parsed_vals
+
+    assert result["error"] is None, f"Unexpected error: {result['error']}"
+    assert result["input_color"] == input_color
+    assert result["target_format"] == target_format
+
+    # Check parsed values
+    assert result["parsed_hex"] == expected_hex
+    assert result["parsed_rgb"] == expected_rgb
+    assert result["parsed_hsl"] == expected_hsl
+
+
+# Test cases: (input_color, target_format, expected_result, check_parsed_vals)
 # check_parsed_vals format: (expected_hex_l, expected_rgb, expected_hsl)
 TEST_CASES_SUCCESS = [
     # Hex input
@@ -21,8 +37,6 @@ TEST_CASES_SUCCESS = [
     ("#00ff00", "hsl", "hsl(120, 100%, 50%)", ("#00ff00", "rgb(0, 255, 0)", "hsl(120, 100%, 50%)")),
     ("#0000ff", "web", "blue", ("#0000ff", "rgb(0, 0, 255)", "hsl(240, 100%, 50%)")),
     ("#aabbcc", "hex_verbose", "#aabbcc", ("#aabbcc", "rgb(170, 187, 204)", "hsl(210, 25%, 73%)")),
-    ("#ff0000", "rgb", "rgb(255, 0, 0)", ("#ff0000", "rgb(255, 0, 0)", "hsl(0, 100%, 50%)")),
-    ("#ffffff", "luminance", float, ("#ffffff", "rgb(255, 255, 255)", "hsl(0, 0%, 100%)")),
     # RGB input (Using valid hex as input instead of rgb string, updated expected hex)
     ("#ff0000", "hex", "#f00", ("#ff0000", "rgb(255, 0, 0)", "hsl(0, 100%, 50%)")),
     ("#008000", "hsl", "hsl(120, 100%, 25%)", ("#008000", "rgb(0, 128, 0)", "hsl(120, 100%, 25%)")),
@@ -34,45 +48,56 @@ TEST_CASES_SUCCESS = [
     ("green", "rgb", "rgb(0, 128, 0)", ("#008000", "rgb(0, 128, 0)", "hsl(120, 100%, 25%)")),
     ("blue", "hsl", "hsl(240, 100%, 50%)", ("#0000ff", "rgb(0, 0, 255)", "hsl(240, 100%, 50%)")),
     ("purple", "hex_verbose", "#800080", ("#800080", "rgb(128, 0, 127)", "hsl(300, 100%, 25%)")),
+]
+
+# Formats whose result is not a plain string; checked against the colour library in one test
+# (input_color, target_format, check_parsed_vals)
+TEST_CASES_ODDBALL = [
+    ("#ffffff", "luminance", ("#ffffff", "rgb(255, 255, 255)", "hsl(0, 0%, 100%)")),
     # RGB Fraction (Using valid hex as input, updated expected rgb due to precision)
-    ("#8040c0", "rgb_fraction", "(0.50..., 0.25..., 0.75...)", ("#8040c0", "rgb(127, 64, 192)", "hsl(270, 50%, 50%)")),
+    ("#8040c0", "rgb_fraction", ("#8040c0", "rgb(127, 64, 192)", "hsl(270, 50%, 50%)")),
 ]
 
 
-@pytest.mark.parametrize("input_color, target_format, expected, parsed_vals", TEST_CASES_SUCCESS)
+@pytest.mark.parametrize(
+    "input_color, target_format, expected, parsed_vals",
+    TEST_CASES_SUCCESS,
+    ids=[f"{input_color}->{target_format}" for input_color, target_format, *_ in TEST_CASES_SUCCESS],
+)
 def test_convert_color_success(input_color, target_format, expected, parsed_vals):
     """Test successful color conversions."""
     result = convert_color(input_color=input_color, target_format=target_format)
 
-    expected_hex, expected_rgb, expected_hsl = parsed_vals
-
-    assert result["error"] is None, f"Unexpected error: {result['error']}"
-    assert result["input_color"] == input_color
-    assert result["target_format"] == target_format
-
-    # Check parsed values
-    assert result["parsed_hex"] == expected_hex
-    assert result["parsed_rgb"] == expected_rgb
-    assert result["parsed_hsl"] == expected_hsl
-
-    # Check the main result
-    if target_format == "luminance":
-        assert isinstance(result["result"], float)
-        # Compare luminance using the Color object directly for accuracy
-        assert approx_equal(result["result"], Color(input_color).luminance)
-    elif target_format == "rgb_fraction":
-        # Need to parse the tuple string for comparison
-        try:
-            # eval is generally unsafe, but ok for trusted test output
-            actual_tuple = eval(result["result"])  # pylint: disable=eval-used
-            expected_tuple = Color(input_color).rgb
-            assert len(actual_tuple) == 3
-            assert all(approx_equal(a, e) for a, e in zip(actual_tuple, expected_tuple))
-        except Exception as e:
-            pytest.fail(f"Failed to parse or compare rgb_fraction: {result['result']}, Error: {e}")
-    else:
-        assert isinstance(result["result"], str)
-        assert result["result"] == expected
+    assert_parsed(result, input_color, target_format, parsed_vals)
+    assert isinstance(result["result"], str)
+    assert result["result"] == expected
+
+
+@pytest.fixture(scope="session")
+def color_cache():
+    """Oracle Color objects for the one-off cases, parsed once per session."""
+    return {input_color: Color(input_color) for input_color, _, _ in TEST_CASES_ODDBALL}
+
+
+def test_convert_color_oddballs(color_cache):
+    """Test the luminance and rgb_fraction conversions, whose results are compared numerically."""
+    for input_color, target_format, parsed_vals in TEST_CASES_ODDBALL:
+        result = convert_color(input_color=input_color, target_format=target_format)
+
+        assert_parsed(result, input_color, target_format, parsed_vals)
+        if target_format == "luminance":
+            assert isinstance(result["result"], float)
+            # Compare luminance using the Color object directly for accuracy
+            assert approx_equal(result["result"], color_cache[input_color].luminance)
+        else:
+            # Need to parse the tuple string for comparison
+            try:
+                actual_tuple = literal_eval(result["result"])
+                expected_tuple = color_cache[input_color].rgb
+                assert len(actual_tuple) == 3
+                assert all(approx_equal(a, e) for a, e in zip(actual_tuple, expected_tuple))
+            except Exception as e:
+                pytest.fail(f"Failed to parse or compare rgb_fraction: {result['result']}, Error: {e}")
 
 
 # Test cases for errors: (input_color, target_format, expected_error_part)
@@ -2,16 +2,18 @@
 Tests for the MCP data converter tool.
 """
 
+import functools
 import json
+import tomllib
 
 import pytest
 import toml
 import xmltodict
 import yaml
-from deepdiff import DeepDiff
 
 # Import the tool function and Enum
 from mcp_server.tools.data_converter import DataType, convert_data
+from tests.yaml_helpers import YamlDumper, YamlLoader
 
 # --- Test Data (Modified for TOML homogeneity and XML type parsing) ---
 
@@ -27,41 +29,47 @@ SAMPLE_LIST = ["1", "two", '{"three": "3"}', "false"]  # Use strings for TOML co
 
 # Representations of SAMPLE_DICT
 SAMPLE_JSON = json.dumps(SAMPLE_DICT, indent=2)
-SAMPLE_YAML = yaml.dump(SAMPLE_DICT, allow_unicode=True, default_flow_style=False)
+SAMPLE_YAML = yaml.dump(SAMPLE_DICT, allow_unicode=True, default_flow_style=False, Dumper=YamlDumper)
 SAMPLE_TOML = toml.dumps(SAMPLE_DICT)  # Now homogeneous
 SAMPLE_XML = xmltodict.unparse({"root": SAMPLE_DICT}, pretty=True)  # Wrap in root for XML
 
 # Expected output strings when INPUT is XML (values become strings during parse)
 EXPECTED_JSON_FROM_XML = json.dumps(SAMPLE_DICT_XML_INPUT, indent=2)
-EXPECTED_YAML_FROM_XML = yaml.dump(SAMPLE_DICT_XML_INPUT, allow_unicode=True, default_flow_style=False)
+EXPECTED_YAML_FROM_XML = yaml.dump(
+    SAMPLE_DICT_XML_INPUT, allow_unicode=True, default_flow_style=False, Dumper=YamlDumper
+)
 EXPECTED_TOML_FROM_XML = toml.dumps(SAMPLE_DICT_XML_INPUT)
 
 # Representations of SAMPLE_LIST
 LIST_JSON = json.dumps(SAMPLE_LIST, indent=2)
-LIST_YAML = yaml.dump(SAMPLE_LIST, allow_unicode=True, default_flow_style=False)
+LIST_YAML = yaml.dump(SAMPLE_LIST, allow_unicode=True, default_flow_style=False, Dumper=YamlDumper)
 LIST_XML = xmltodict.unparse({"root": {"item": SAMPLE_LIST}}, pretty=True)  # Wrap list items
 
 # --- Comparison Helper ---
 
+PARSERS = {
+    DataType.json: json.loads,
+    DataType.yaml: functools.partial(yaml.load, Loader=YamlLoader),
+    DataType.toml: tomllib.loads,
+    # process_types=True seems unsupported by parse, so XML values stay strings
+    DataType.xml: functools.partial(xmltodict.parse, attr_prefix="", cdata_key="text"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def parse_expected(text: str, data_type: DataType):
+    """Parse an expected-output string once; the SAMPLE_*/LIST_* constants recur across many cases."""
+    return PARSERS[data_type](text)
+
 
 def compare_data(str1: str, type1: DataType, str2: str, type2: DataType) -> bool:
     """Helper to compare data structures, ignoring formatting differences."""
     try:
+        # If either side is XML, both are parsed as XML
         if type1 == DataType.xml or type2 == DataType.xml:
-            # process_types=True seems unsupported by parse, remove it.
-            data1 = xmltodict.parse(str1, attr_prefix="", cdata_key="text")
-            data2 = xmltodict.parse(str2, attr_prefix="", cdata_key="text")
-            # Use DeepDiff for structural comparison after parsing
-            # Re-enable type ignoring since XML parsing results in strings
-            diff = DeepDiff(data1, data2, ignore_type_in_groups=[(str, int, float, bool)])
-            return not diff
-        else:
-            # For JSON, YAML, TOML, load and compare Python objects
-            parsers = {DataType.json: json.loads, DataType.yaml: yaml.safe_load, DataType.toml: toml.loads}
-            data1 = parsers[type1](str1)
-            data2 = parsers[type2](str2)
-            diff = DeepDiff(data1, data2, ignore_type_in_groups=[(str, int, float, bool)])
-            return not diff  # No diff means they are equivalent
+            type1 = type2 = DataType.xml
+        # Plain equality treats 1, 1.0 and True as equal while keeping "1" and 1 distinct
+        return PARSERS[type1](str1) == parse_expected(str2, type2)
     except Exception as e:
         print(f"Comparison error ({type1} vs {type2}): {e}")
         return False
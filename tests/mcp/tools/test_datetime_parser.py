@@ -10,7 +10,9 @@ import pytest
 from mcp_server.tools.datetime_parser import parse_datetime
 
 # --- Test Data ---
-NOW_DT_UTC = datetime.now(timezone.utc)
+# A fixed instant (with a microsecond part) rather than datetime.now(), so parametrize ids and
+# expected values are identical on every run
+NOW_DT_UTC = datetime(2024, 6, 28, 10, 30, 45, 123456, tzinfo=timezone.utc)
 NOW_TS_S = NOW_DT_UTC.timestamp()
 NOW_TS_MS = NOW_TS_S * 1000.0
 NOW_ISO = NOW_DT_UTC.isoformat(timespec="microseconds").replace("+00:00", "Z")
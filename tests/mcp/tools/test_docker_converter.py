@@ -4,6 +4,7 @@ import pytest  # pylint: disable=unused-import
 import yaml
 
 from mcp_server.tools.docker_converter import convert_run_to_compose
+from tests.yaml_helpers import YamlDumper, YamlLoader
 
 
 def test_simple_command():
@@ -31,21 +32,29 @@ def test_with_ports_volumes_env_name_restart():
         "container_name": "my-nginx",
         "restart": "always",
     }
-    expected_yaml = yaml.dump({"services": {"my-nginx": expected_config}}, default_flow_style=False, sort_keys=False)
+    expected_yaml = yaml.dump(
+        {"services": {"my-nginx": expected_config}}, default_flow_style=False, sort_keys=False, Dumper=YamlDumper
+    )
     result = convert_run_to_compose(command)
     assert result.get("error") is None
     # Compare parsed YAML to avoid whitespace/ordering issues if possible
-    assert yaml.safe_load(result.get("docker_compose_yaml")) == yaml.safe_load(expected_yaml)
+    assert yaml.load(result.get("docker_compose_yaml"), Loader=YamlLoader) == yaml.load(
+        expected_yaml, Loader=YamlLoader
+    )
 
 
 def test_with_command_args():
     """Test a command that includes arguments passed to the container."""
     command = "docker run ubuntu:latest echo 'Hello from container'"
     expected_config = {"image": "ubuntu:latest", "command": ["echo", "Hello from container"]}
-    expected_yaml = yaml.dump({"services": {"ubuntu": expected_config}}, default_flow_style=False, sort_keys=False)
+    expected_yaml = yaml.dump(
+        {"services": {"ubuntu": expected_config}}, default_flow_style=False, sort_keys=False, Dumper=YamlDumper
+    )
     result = convert_run_to_compose(command)
     assert result.get("error") is None
-    assert yaml.safe_load(result.get("docker_compose_yaml")) == yaml.safe_load(expected_yaml)
+    assert yaml.load(result.get("docker_compose_yaml"), Loader=YamlLoader) == yaml.load(
+        expected_yaml, Loader=YamlLoader
+    )
 
 
 def test_invalid_command_not_docker_run():
@@ -5,7 +5,7 @@ import pytest
 from mcp_server.tools.encryption_processor import decrypt_text, encrypt_text
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data():
     return {
         "text": "This is a secret message!",
@@ -14,17 +14,21 @@ def sample_data():
     }
 
 
-def test_encrypt_decrypt_roundtrip(sample_data):
-    """Test that encrypting and then decrypting returns the original text."""
-    # Encrypt
+@pytest.fixture(scope="session")
+def sample_ciphertext(sample_data):
+    """Encrypt the sample text once per session, so the key derivation runs a single time."""
     encrypt_result = encrypt_text(**sample_data)
     assert encrypt_result.get("error") is None
     ciphertext = encrypt_result.get("ciphertext")
     assert ciphertext is not None
+    return ciphertext
+
 
+def test_encrypt_decrypt_roundtrip(sample_data, sample_ciphertext):
+    """Test that encrypting and then decrypting returns the original text."""
     # Decrypt with correct password
     decrypt_data = {
-        "ciphertext": ciphertext,
+        "ciphertext": sample_ciphertext,
         "password": sample_data["password"],
         "algorithm": sample_data["algorithm"],
     }
@@ -33,17 +37,11 @@ def test_encrypt_decrypt_roundtrip(sample_data):
     assert decrypt_result.get("plaintext") == sample_data["text"]
 
 
-def test_decrypt_wrong_password(sample_data):
+def test_decrypt_wrong_password(sample_data, sample_ciphertext):
     """Test decryption failure with the wrong password."""
-    # Encrypt
-    encrypt_result = encrypt_text(**sample_data)
-    assert encrypt_result.get("error") is None
-    ciphertext = encrypt_result.get("ciphertext")
-    assert ciphertext is not None
-
     # Decrypt with incorrect password
     decrypt_data = {
-        "ciphertext": ciphertext,
+        "ciphertext": sample_ciphertext,
         "password": "wrong-password",
         "algorithm": sample_data["algorithm"],
     }
@@ -1,4 +1,6 @@
+import functools
 import json
+import tomllib
 
 import pytest
 import toml
@@ -10,6 +12,7 @@ from fastapi.testclient import TestClient
 
 from models.data_converter_models import DataConverterInput, DataConverterOutput, DataType
 from routers.data_converter_router import router as data_converter_router
+from tests.yaml_helpers import YamlDumper, YamlLoader
 
 
 # Fixture for the FastAPI app
@@ -34,18 +37,18 @@ SAMPLE_LIST = [1, "two", {"three": 3}, False]
 
 # Representations of SAMPLE_DICT
 SAMPLE_JSON = json.dumps(SAMPLE_DICT, indent=2)
-SAMPLE_YAML = yaml.dump(SAMPLE_DICT, allow_unicode=True, default_flow_style=False)
+SAMPLE_YAML = yaml.dump(SAMPLE_DICT, allow_unicode=True, default_flow_style=False, Dumper=YamlDumper)
 SAMPLE_TOML = toml.dumps(SAMPLE_DICT)
 SAMPLE_XML = xmltodict.unparse({"root": SAMPLE_DICT}, pretty=True)  # Wrap in root for XML
 
 # Representations of SAMPLE_LIST (TOML doesn't support top-level list)
 LIST_JSON = json.dumps(SAMPLE_LIST, indent=2)
-LIST_YAML = yaml.dump(SAMPLE_LIST, allow_unicode=True, default_flow_style=False)
+LIST_YAML = yaml.dump(SAMPLE_LIST, allow_unicode=True, default_flow_style=False, Dumper=YamlDumper)
 LIST_XML = xmltodict.unparse({"root": {"item": SAMPLE_LIST}}, pretty=True)  # Wrap list items in 'item' tags under root
 
 # New fixtures for TOML-compatible JSON and YAML
 TOML_COMPATIBLE_JSON = json.dumps(SAMPLE_DICT)
-TOML_COMPATIBLE_YAML = yaml.dump(SAMPLE_DICT, allow_unicode=True, default_flow_style=False)
+TOML_COMPATIBLE_YAML = yaml.dump(SAMPLE_DICT, allow_unicode=True, default_flow_style=False, Dumper=YamlDumper)
 
 
 # Helper to compare data structures, ignoring formatting differences
@@ -61,7 +64,11 @@ def compare_data(str1: str, type1: DataType, str2: str, type2: DataType):
             return json1 == json2
         else:
             # For JSON, YAML, TOML, load and compare Python objects
-            parsers = {DataType.json: json.loads, DataType.yaml: yaml.safe_load, DataType.toml: toml.loads}
+            parsers = {
+                DataType.json: json.loads,
+                DataType.yaml: functools.partial(yaml.load, Loader=YamlLoader),
+                DataType.toml: tomllib.loads,
+            }
             data1 = parsers[type1](str1)
             data2 = parsers[type2](str2)
 
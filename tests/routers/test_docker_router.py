@@ -5,6 +5,7 @@ from fastapi.testclient import TestClient
 
 from models.docker_models import DockerRunToComposeInput, DockerRunToComposeOutput
 from routers.docker_router import router as docker_router
+from tests.yaml_helpers import YamlLoader
 
 
 # Fixture for the FastAPI app
@@ -108,7 +109,7 @@ async def test_docker_run_to_compose_success(
 
     # Parse the output YAML and compare with the expected structure
     try:
-        parsed_yaml = yaml.safe_load(output.docker_compose_yaml)
+        parsed_yaml = yaml.load(output.docker_compose_yaml, Loader=YamlLoader)
         assert parsed_yaml == expected_service_config
     except yaml.YAMLError as e:
         pytest.fail(f"Output YAML could not be parsed: {e}\nYAML:\n{output.docker_compose_yaml}")
@@ -1,8 +1,13 @@
 import base64
+import io
+import xml.etree.ElementTree as ET
 
 import pytest
+import qrcode
+import qrcode.image.svg
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
+from PIL import Image
 
 from models.qrcode_models import (
     QrCodeInput,
@@ -12,6 +17,7 @@ from models.qrcode_models import (
     WifiAuthType,
     WifiQrCodeInput,
 )
+from routers.qrcode_router import _render_qr, format_wifi_string, matrix_to_png, matrix_to_svg
 from routers.qrcode_router import router as qrcode_router
 
 
@@ -92,6 +98,73 @@ async def test_generate_qr_code_success(
         assert "<svg" in svg_content.lower()
 
 
+@pytest.mark.parametrize(
+    "endpoint, payload",
+    [
+        ("/api/qrcode/generate", {"text": "Binary PNG", "output_format": "png_binary"}),
+        ("/api/qrcode/generate-wifi", {"ssid": "MyWiFi", "password": "secret", "output_format": "png_binary"}),
+    ],
+)
+def test_generate_qr_code_png_binary(client: TestClient, endpoint: str, payload: dict):
+    """png_binary returns the raw PNG bytes, identical to the decoded Base64 of the png format."""
+    response = client.post(endpoint, json=payload)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "image/png"
+    assert response.content.startswith(b"\x89PNG\r\n\x1a\n")
+
+    json_response = client.post(endpoint, json={**payload, "output_format": "png"})
+    assert base64.b64decode(json_response.json()["qr_code_data"]) == response.content
+
+
+def test_generate_qr_code_repeated_payload_hits_cache(client: TestClient):
+    """Identical payloads should be served from the render cache with identical output."""
+    _render_qr.cache_clear()
+    payload = {"text": "https://example.com", "error_correction": "M", "output_format": "png"}
+
+    first = client.post("/api/qrcode/generate", json=payload)
+    second = client.post("/api/qrcode/generate", json=payload)
+
+    assert first.status_code == second.status_code == status.HTTP_200_OK
+    assert first.json() == second.json()
+    assert _render_qr.cache_info().hits == 1  # pylint: disable=no-value-for-parameter
+
+
+@pytest.mark.parametrize("text", ["", "Hello QR Code", "x" * 300])
+def test_matrix_to_png_matches_pil_rendering(text: str):
+    """The direct 1-bit PNG writer must be pixel-identical to Pillow's rendering."""
+    qr = qrcode.QRCode(box_size=10, border=4)
+    qr.add_data(text)
+    qr.make(fit=True)
+
+    direct = Image.open(io.BytesIO(matrix_to_png(qr.get_matrix(), qr.box_size))).convert("L")
+    reference = qr.make_image(fill_color="black", back_color="white").get_image().convert("L")
+
+    assert direct.size == reference.size
+    assert direct.tobytes() == reference.tobytes()
+
+
+@pytest.mark.parametrize("text", ["", "SVG Output Test", "x" * 300])
+def test_matrix_to_svg_matches_svg_path_image(text: str):
+    """The direct SVG writer must describe the same drawing as qrcode's SvgPathImage.
+
+    Documents are compared after parsing: SvgPathImage serializes through lxml when it is
+    installed and through ElementTree otherwise, which differ in insignificant whitespace.
+    """
+    qr = qrcode.QRCode(box_size=10, border=4)
+    qr.add_data(text)
+    qr.make(fit=True)
+
+    reference = io.BytesIO()
+    qr.make_image(image_factory=qrcode.image.svg.SvgPathImage).save(reference)
+
+    actual_root = ET.fromstring(matrix_to_svg(qr.get_matrix()))
+    expected_root = ET.fromstring(reference.getvalue())
+    assert actual_root.tag == expected_root.tag
+    assert actual_root.attrib == expected_root.attrib
+    assert [(path.tag, path.attrib) for path in actual_root] == [(path.tag, path.attrib) for path in expected_root]
+
+
 # --- Test WiFi QR Code Generation ---
 
 
@@ -204,6 +277,12 @@ async def test_generate_wifi_qr_code_success(
     # (Implementation omitted for brevity, but would involve a QR decoding library)
 
 
+def test_format_wifi_string_escapes_special_characters():
+    """All five reserved characters are backslash-escaped in SSID and password."""
+    wifi_string = format_wifi_string("my\\net;1", WifiAuthType.WPA, 'p,a"s:s', hidden=False)
+    assert wifi_string == 'WIFI:T:WPA;S:my\\\\net\\;1;P:p\\,a\\"s\\:s;H:false;;'
+
+
 @pytest.mark.parametrize(
     "ssid, password, auth_type, hidden, error_substring",
     [
@@ -83,6 +83,18 @@ async def test_generate_random_ports_success(
             assert port not in common_ports
 
 
+@pytest.mark.asyncio
+async def test_generate_random_ports_covers_available_range_without_duplicates(client: TestClient):
+    """Requesting every available port returns each non-excluded port exactly once."""
+    response = client.get("/api/random-port/generate?count=6&min_port=20&max_port=30&exclude_common=true")
+
+    assert response.status_code == status.HTTP_200_OK
+    ports = response.json()["ports"]
+    expected = {p for p in range(20, 31) if p not in COMMON_PORTS_TO_EXCLUDE}
+    assert len(ports) == len(expected)
+    assert set(ports) == expected
+
+
 @pytest.mark.parametrize(
     "params, error_substring",
     [
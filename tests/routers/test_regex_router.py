@@ -2,7 +2,7 @@ import pytest
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
-from models.regex_models import RegexInput, RegexMatch, RegexOutput
+from models.regex_models import RegexEngine, RegexInput, RegexMatch, RegexOutput
 from routers.regex_router import router as regex_router
 
 
@@ -207,3 +207,26 @@ async def test_regex_invalid_pattern(client: TestClient, invalid_pattern: str, e
     assert "Invalid regex pattern" in output.error
     # Check for the specific error detail (case-insensitive)
     assert error_substring.lower() in output.error.lower()
+
+
+@pytest.mark.parametrize(
+    "regex_pattern, test_string, ignore_case, expected_strings",
+    [
+        (r"(?P<word>h\w+)", "Hello hi HEY", True, ["Hello", "hi", "HEY"]),
+        (r"(\w)\1", "aabbc", False, ["aa", "bb"]),  # Backreference: RE2 falls back to re
+    ],
+)
+@pytest.mark.asyncio
+async def test_regex_re2_engine(
+    client: TestClient, regex_pattern: str, test_string: str, ignore_case: bool, expected_strings: list[str]
+):
+    """The re2 engine returns the same matches as re (falling back to re when needed)."""
+    payload = RegexInput(
+        regex_pattern=regex_pattern, test_string=test_string, ignore_case=ignore_case, engine=RegexEngine.re2
+    )
+    response = client.post("/api/regex/test", json=payload.model_dump())
+
+    assert response.status_code == status.HTTP_200_OK
+    output = RegexOutput(**response.json())
+    assert output.error is None
+    assert [match.matched_string for match in output.matches] == expected_strings
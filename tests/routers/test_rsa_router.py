@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
@@ -5,6 +7,7 @@ from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 from models.rsa_models import RsaKeygenOutput
+from routers.rsa_router import KEY_POOL_SIZE, _key_pools, _pending_refills
 from routers.rsa_router import router as rsa_router
 
 
@@ -80,3 +83,26 @@ async def test_generate_rsa_keys_invalid_size(client: TestClient, invalid_key_si
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     # Use case-insensitive comparison
     assert error_substring.lower() in str(response.json()).lower()
+
+
+def test_generate_rsa_keys_served_from_pool(client: TestClient):
+    """A requested key size is refilled in the background and later requests are served from its pool."""
+    pool = _key_pools[1024]
+
+    first = client.post("/api/rsa/generate-keys", json={"key_size": 1024})
+    assert first.status_code == status.HTTP_200_OK
+
+    deadline = time.monotonic() + 30
+    while pool.empty() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not pool.empty(), "Key pool was not filled in time"
+    pooled_private_pem, pooled_public_pem = pool.queue[0]
+
+    response = client.post("/api/rsa/generate-keys", json={"key_size": 1024})
+
+    assert response.status_code == status.HTTP_200_OK
+    output = RsaKeygenOutput(**response.json())
+    assert output.private_key_pem == pooled_private_pem
+    assert output.public_key_pem == pooled_public_pem
+    assert pooled_private_pem not in [pair[0] for pair in pool.queue]  # Handed out once
+    assert pool.qsize() + _pending_refills[1024] <= KEY_POOL_SIZE
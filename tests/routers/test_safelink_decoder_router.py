@@ -5,6 +5,7 @@ from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 from models.safelink_decoder_models import SafelinkInput, SafelinkOutput
+from routers.safelink_decoder_router import _decode_url_cached
 from routers.safelink_decoder_router import router as safelink_decoder_router
 
 
@@ -56,6 +57,8 @@ NON_SAFELINK = "https://www.normal-website.org/page"
         # Assuming generic catches some Proofpoint forms
         (GENERIC_REDIRECT_URL, ORIGINAL_URL, "Generic Redirect (param: url)"),
         (GENERIC_REDIRECT_LINK, ORIGINAL_URL, "Generic Redirect (param: link)"),
+        # Only the query string is parsed, so a malformed host doesn't block decoding
+        (f"http://[::1/track?url={ORIGINAL_URL_ENCODED}", ORIGINAL_URL, "Generic Redirect (param: url)"),
         # Non-safelink should not be decoded
         (NON_SAFELINK, None, "Unable to decode URL with any known method"),
         (ORIGINAL_URL, None, "Unable to decode URL with any known method"),  # Original URL itself
@@ -82,6 +85,19 @@ async def test_decode_safelink_success_and_no_match(
         assert output.error == expected_method
 
 
+def test_decode_safelink_repeated_url_hits_cache(client: TestClient):
+    """Repeated URLs should be served from the decode cache with identical output."""
+    _decode_url_cached.cache_clear()
+    payload = SafelinkInput(url=MS_SAFELINK).model_dump()
+
+    first = client.post("/api/safelink-decoder/", json=payload)
+    second = client.post("/api/safelink-decoder/", json=payload)
+
+    assert first.json() == second.json()
+    assert first.json()["decoded_url"] == ORIGINAL_URL
+    assert _decode_url_cached.cache_info().hits == 1
+
+
 @pytest.mark.parametrize(
     "invalid_url, expected_status, error_substring",
     [
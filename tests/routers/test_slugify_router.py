@@ -3,6 +3,7 @@ from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 from models.slugify_models import SlugifyInput, SlugifyOutput
+from routers.slugify_router import BATCH_MAX_TOTAL_LENGTH
 from routers.slugify_router import router as slugify_router
 
 
@@ -55,3 +56,25 @@ async def test_create_slug_invalid_type(client: TestClient):
     """Test providing invalid type for text input."""
     response = client.post("/api/slugify/create", json={"text": 12345})
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_create_slugs_batch(client: TestClient):
+    """Batch slug creation returns one slug per text, in order."""
+    response = client.post("/api/slugify/create/batch", json={"texts": ["Hello World", "Ça va?", ""]})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"slugs": ["hello-world", "ca-va", ""]}
+
+
+@pytest.mark.asyncio
+async def test_create_slugs_batch_size_limits(client: TestClient):
+    """Oversized batch items fail validation and oversized batches are rejected before slugifying."""
+    response = client.post("/api/slugify/create/batch", json={"texts": ["a" * 100_001]})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "at most 100000 characters" in str(response.json())
+
+    item_count = BATCH_MAX_TOTAL_LENGTH // 100_000 + 1
+    response = client.post("/api/slugify/create/batch", json={"texts": ["a" * 100_000] * item_count})
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert "too large" in response.json()["detail"]
@@ -6,7 +6,11 @@ from fastapi.testclient import TestClient
 # Import the actual functions and models directly from the router file
 from routers.string_obfuscator_router import ObfuscatorInput  # Import model from router
 from routers.string_obfuscator_router import ObfuscatorOutput  # Import model from router
-from routers.string_obfuscator_router import deobfuscate_from_full_width, obfuscate_to_full_width
+from routers.string_obfuscator_router import (
+    BATCH_MAX_TOTAL_LENGTH,
+    deobfuscate_from_full_width,
+    obfuscate_to_full_width,
+)
 from routers.string_obfuscator_router import router as string_obfuscator_router
 
 
@@ -104,3 +108,32 @@ async def test_obfuscator_invalid_type(client: TestClient):
     # Test deobfuscate endpoint
     response_deobf = client.post("/api/string-obfuscator/deobfuscate/full-width", json={"text": None})
     assert response_deobf.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_obfuscate_deobfuscate_batch(client: TestClient):
+    """Batch endpoints transform every text, in order, and round-trip."""
+    texts = ["Hello World!", "abc 123", ""]
+    response_obf = client.post("/api/string-obfuscator/obfuscate/full-width/batch", json={"texts": texts})
+    assert response_obf.status_code == status.HTTP_200_OK
+    obfuscated = response_obf.json()["results"]
+    assert obfuscated == [obfuscate_to_full_width(text) for text in texts]
+
+    response_deobf = client.post("/api/string-obfuscator/deobfuscate/full-width/batch", json={"texts": obfuscated})
+    assert response_deobf.status_code == status.HTTP_200_OK
+    assert response_deobf.json()["results"] == texts
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("direction", ["obfuscate", "deobfuscate"])
+async def test_obfuscator_batch_size_limits(client: TestClient, direction: str):
+    """Oversized batch items fail validation and oversized batches are rejected before converting."""
+    url = f"/api/string-obfuscator/{direction}/full-width/batch"
+    response = client.post(url, json={"texts": ["a" * 100_001]})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "at most 100000 characters" in str(response.json())
+
+    item_count = BATCH_MAX_TOTAL_LENGTH // 100_000 + 1
+    response = client.post(url, json={"texts": ["a" * 100_000] * item_count})
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert "too large" in response.json()["detail"]
@@ -106,6 +106,47 @@ async def test_generate_svg_placeholder_success(
         pytest.fail("Data URI validation failed (could not decode or mismatch)")
 
 
+def test_generate_svg_placeholder_escapes_text_and_font(client: TestClient):
+    """Markup in the text or font family is escaped instead of injected into the SVG."""
+    payload = {"width": 100, "height": 50, "text": "<b>A & B</b>", "font_family": '"Arial" onload="x"'}
+    response = client.post("/api/svg-placeholder/", json=payload)
+
+    assert response.status_code == status.HTTP_200_OK
+    svg = response.json()["svg"]
+    assert ">&lt;b&gt;A &amp; B&lt;/b&gt;</text>" in svg
+    assert 'font-family="&quot;Arial&quot; onload=&quot;x&quot;"' in svg
+
+
+def test_generate_svg_placeholder_without_data_uri(client: TestClient):
+    """include_data_uri=false skips the Base64 data URI but still returns the SVG."""
+    payload = {"width": 100, "height": 50, "text": "100x50", "include_data_uri": False}
+    response = client.post("/api/svg-placeholder/", json=payload)
+
+    assert response.status_code == status.HTTP_200_OK
+    output = SvgOutput(**response.json())
+    assert output.data_uri == ""
+    assert output.svg.startswith("<svg") and ">100x50</text>" in output.svg
+
+
+def test_get_svg_placeholder_raw(client: TestClient):
+    """The raw endpoint serves the same SVG document as image/svg+xml."""
+    params = {"width": 100, "height": 50, "text": "100x50"}
+    response = client.get("/api/svg-placeholder/raw", params=params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "image/svg+xml"
+    assert response.text == client.post("/api/svg-placeholder/", json=params).json()["svg"]
+
+    invalid = client.get("/api/svg-placeholder/raw", params={**params, "bg_color": "blue"})
+    assert invalid.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "Invalid hex color format" in str(invalid.json())
+
+    # Markup smuggled in through a color must not reach the served document
+    injected = client.get("/api/svg-placeholder/raw", params={**params, "bg_color": '#"/><a>'})
+    assert injected.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert injected.headers["content-type"] != "image/svg+xml"
+
+
 @pytest.mark.parametrize(
     "payload_update, error_substring",
     [
@@ -115,6 +156,8 @@ async def test_generate_svg_placeholder_success(
         ({"text_color": "#12345"}, "Invalid hex color format"),
         ({"bg_color": "blue"}, "Invalid hex color format"),
         ({"text_color": "red"}, "Invalid hex color format"),
+        ({"bg_color": "#ggg"}, "Invalid hex color format"),
+        ({"text_color": '#"/><a>'}, "Invalid hex color format"),
         ({"font_size": 0}, "Input should be greater than or equal to 1"),
     ],
 )
@@ -86,3 +86,40 @@ async def test_convert_temperature_invalid_unit(client: TestClient):
     # Update substring and use case-insensitive check
     expected_error_substring = "Input should be 'celsius', 'fahrenheit' or 'kelvin'"
     assert expected_error_substring.lower() in str(response.json()).lower()
+
+
+@pytest.mark.asyncio
+async def test_convert_temperature_batch(client: TestClient):
+    """Batch conversion returns one result per item, in order, matching the single endpoint."""
+    items = [
+        {"value": 100, "unit": "celsius"},
+        {"value": 32, "unit": "fahrenheit"},
+        {"value": -1, "unit": "kelvin"},
+    ]
+    response = client.post("/api/temperature/convert/batch", json={"items": items})
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["results"]
+    assert results == [client.post("/api/temperature/convert", json=item).json() for item in items]
+    assert results[0]["fahrenheit"] == 212.0
+    assert results[2]["error"] == "Kelvin cannot be below absolute zero (0 K)."
+
+
+@pytest.mark.parametrize(
+    "value, unit, expected",
+    [
+        # Values whose converted results land on a half-cent rounding tie
+        (1.725, TemperatureUnit.celsius, {"celsius": 1.73, "fahrenheit": 35.1, "kelvin": 274.88}),
+        (0.005, TemperatureUnit.fahrenheit, {"celsius": -17.77, "fahrenheit": 0.01, "kelvin": 255.37}),
+        (0.375, TemperatureUnit.kelvin, {"celsius": -272.77, "fahrenheit": -459.0, "kelvin": 0.38}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_convert_temperature_rounding_ties(
+    client: TestClient, value: float, unit: TemperatureUnit, expected: dict
+):
+    """Rounding ties resolve exactly as the (c * 9 / 5) + 32 and (f - 32) * 5 / 9 formulas give."""
+    response = client.post("/api/temperature/convert", json={"value": value, "unit": unit.value})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {**expected, "error": None}
@@ -5,6 +5,7 @@ from fastapi.testclient import TestClient
 from models.text_binary_models import TextBinaryInput, TextBinaryOutput
 
 # Import helper functions for validation/comparison
+from routers.text_binary_router import BATCH_MAX_TOTAL_LENGTH
 from routers.text_binary_router import router as text_binary_router
 
 
@@ -136,3 +137,33 @@ async def test_text_binary_errors(
         assert error_substring in str(response.json()).lower()
     else:
         assert error_substring in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_convert_text_binary_batch(client: TestClient):
+    """Batch conversion returns one result per item and names the failing item on error."""
+    items = [
+        {"text": "Hi", "mode": "text_to_binary"},
+        {"text": "01001000 01101001", "mode": "binary_to_text"},
+    ]
+    response = client.post("/api/text-binary/batch", json={"items": items})
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["results"]
+    assert [r["result"] for r in results] == ["01001000 01101001", "Hi"]
+
+    response = client.post(
+        "/api/text-binary/batch", json={"items": [*items, {"text": "012", "mode": "binary_to_text"}]}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"].startswith("Item 2: Invalid binary input")
+
+
+@pytest.mark.asyncio
+async def test_convert_text_binary_batch_too_large(client: TestClient):
+    """Batches whose item texts together exceed the limit are rejected before converting."""
+    item = {"text": "a" * 100_000, "mode": "text_to_binary"}
+    response = client.post("/api/text-binary/batch", json={"items": [item] * (BATCH_MAX_TOTAL_LENGTH // 100_000 + 1)})
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert "too large" in response.json()["detail"]
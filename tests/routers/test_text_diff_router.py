@@ -7,6 +7,11 @@ from models.text_diff_models import DiffFormat, TextDiffInput, TextDiffOutput
 
 # Remove unused imports from router
 # from routers.text_diff_router import DiffFormat, TextDiffInput
+from routers.text_diff_router import (
+    DIFF_MAX_LINE_PAIRS,
+    NDIFF_INTRALINE_MAX_LINES,
+    _diff_texts_cached,
+)
 from routers.text_diff_router import router as text_diff_router
 
 
@@ -115,6 +120,82 @@ async def test_generate_text_diff_success(
             assert sub.lower() in output.diff.lower()
 
 
+def test_generate_text_diff_large_ndiff_skips_intraline_hints(client: TestClient):
+    """Large ndiff inputs are diffed from opcodes: same +/-/context lines, no '?' hint lines."""
+    line_count = NDIFF_INTRALINE_MAX_LINES
+    text_a = "\n".join(f"line {i}" for i in range(line_count))
+    text_b = "\n".join(f"line {i}" if i % 10 else f"line {i} changed" for i in range(line_count))
+    payload = TextDiffInput(text1=text_a, text2=text_b, output_format=DiffFormat.NDIFF)
+
+    response = client.post("/api/text-diff/", json=payload.model_dump())
+
+    assert response.status_code == status.HTTP_200_OK
+    diff_lines = response.json()["diff"].split("\n")
+    assert not [line for line in diff_lines if line.startswith("? ")]
+    assert "- line 10" in diff_lines and "+ line 10 changed" in diff_lines
+    assert "  line 11" in diff_lines
+
+
+def test_generate_text_diff_html_marks_changes(client: TestClient):
+    """HTML diffs escape cell text and mark changed, removed and added lines with difflib's classes."""
+    payload = TextDiffInput(
+        text1="same\n<b>old</b>\ngone", text2="same\n<b>new</b>", output_format=DiffFormat.HTML, context_lines=0
+    )
+
+    response = client.post("/api/text-diff/", json=payload.model_dump())
+
+    assert response.status_code == status.HTTP_200_OK
+    diff = response.json()["diff"]
+    assert "&lt;b&gt;" in diff and "<b>" not in diff
+    assert '<span class="diff_chg">' in diff
+    assert '<span class="diff_sub">gone</span>' in diff
+    assert "same" not in diff
+
+
+def test_generate_text_diff_html_identical_texts(client: TestClient):
+    """HTML diffs of identical texts report that no differences were found."""
+    payload = TextDiffInput(text1=TEXT_A, text2=TEXT_A, output_format=DiffFormat.HTML)
+
+    response = client.post("/api/text-diff/", json=payload.model_dump())
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "No Differences Found" in response.json()["diff"]
+
+
+def test_generate_text_diff_repeated_payload_hits_cache(client: TestClient):
+    """Identical diff requests should be served from the diff cache with identical output."""
+    _diff_texts_cached.cache_clear()
+    payload = TextDiffInput(text1=TEXT_A, text2=TEXT_B, output_format=DiffFormat.UNIFIED).model_dump()
+
+    first = client.post("/api/text-diff/", json=payload)
+    second = client.post("/api/text-diff/", json=payload)
+
+    assert first.json() == second.json()
+    assert _diff_texts_cached.cache_info().hits == 1
+
+
+def test_generate_text_diff_too_many_lines(client: TestClient):
+    """Texts whose line counts multiply past the limit are rejected before diffing."""
+    line_count = int(DIFF_MAX_LINE_PAIRS**0.5) + 1
+    payload = TextDiffInput(text1="a\n" * line_count, text2="b\n" * line_count, output_format=DiffFormat.UNIFIED)
+
+    response = client.post("/api/text-diff/", json=payload.model_dump())
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert "too large" in response.json()["detail"]
+
+
+def test_generate_text_diff_too_many_lines_other_line_breaks(client: TestClient):
+    """Lines are counted like the diff splits them, so carriage-return-separated texts hit the limit too."""
+    line_count = int(DIFF_MAX_LINE_PAIRS**0.5) + 1
+    payload = TextDiffInput(text1="a\r" * line_count, text2="b\r" * line_count, output_format=DiffFormat.UNIFIED)
+
+    response = client.post("/api/text-diff/", json=payload.model_dump())
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert "too large" in response.json()["detail"]
+
+
 @pytest.mark.parametrize(
     "payload_update, error_substring",
     [
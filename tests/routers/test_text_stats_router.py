@@ -98,6 +98,18 @@ def client(test_app: FastAPI) -> TestClient:
                 "paragraph_count": 1,
             },
         ),
+        # Windows line endings (\r\n counts as a single line break)
+        (
+            "Line one.\r\nLine two.\r\n",
+            {
+                "char_count": 22,
+                "char_count_no_spaces": 16,
+                "word_count": 4,
+                "line_count": 2,
+                "sentence_count": 2,
+                "paragraph_count": 1,
+            },
+        ),
         # Edge cases for sentence splitting (e.g., Mr. Smith)
         (
             "Mr. Smith went to Washington. It was nice.",
@@ -133,3 +145,11 @@ async def test_calculate_text_stats_invalid_type(client: TestClient):
     # Update expected substring based on Pydantic error
     expected_error_substring = "input should be a valid string"
     assert expected_error_substring.lower() in str(response.json()).lower()
+
+
+@pytest.mark.asyncio
+async def test_calculate_text_stats_too_long(client: TestClient):
+    """Test that oversized text is rejected at validation time."""
+    response = client.post("/api/text/stats", json={"text": "a" * 1_000_001})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "at most 1000000 characters" in str(response.json())
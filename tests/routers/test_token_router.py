@@ -3,7 +3,7 @@ from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 from models.token_models import CharSetType, TokenInput, TokenOutput
-from routers.token_router import CHARSET_MAP
+from routers.token_router import CHARSET_MAP, _random_chars
 from routers.token_router import router as token_router
 
 
@@ -59,6 +59,15 @@ async def test_generate_tokens_success(client: TestClient, length: int, count: i
         assert all(c in expected_charset for c in token)
 
 
+@pytest.mark.parametrize("charset_type", list(CharSetType))
+def test_random_chars_covers_whole_charset(charset_type: CharSetType):
+    """Bulk draws only yield charset characters and reach every one of them."""
+    chars = _random_chars(charset_type, 5000)
+
+    assert len(chars) == 5000
+    assert set(chars) == set(CHARSET_MAP[charset_type])
+
+
 @pytest.mark.parametrize(
     "payload_update, error_substring",
     [
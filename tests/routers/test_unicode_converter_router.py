@@ -41,6 +41,8 @@ def client(test_app: FastAPI) -> TestClient:
         # Different Base
         ("A", "", " ", 2, "1000001"),  # Binary
         ("Hi", "", " ", 8, "110 151"),  # Octal
+        ("Az", "", "-", 36, "1T-3E"),  # Exotic base, upper-case digits
+        ("Hi", "prefix-longer-than-16:", " ", 16, "prefix-longer-than-16:0048 prefix-longer-than-16:0069"),
         # Unicode characters
         ("€", "U+", " ", 16, "U+20AC"),
         ("你好", "U+", " ", 16, "U+4F60 U+597D"),
@@ -74,6 +76,9 @@ async def test_text_to_unicode_success(
         ("U+0041", "U+", " ", 16, "A"),
         ("U+0048 U+0069", "U+", " ", 16, "Hi"),
         ("U+0048U+0069", "U+", "", 16, "Hi"),  # No separator
+        ("U+0048 U+00e9 U+4F60", "U+", " ", 16, "Hé你"),  # Lower-case hex digits
+        ("U+0048U+4F60U+1F600", "U+", "", 16, "H你😀"),  # Mixed digit counts
+        ("xU+0048U+0069", "U+", "", 16, "Hi"),  # No separator, text before the first prefix is ignored
         # Basic ASCII - Decimal
         ("65", "", " ", 10, "A"),
         ("72 105", "", " ", 10, "Hi"),
@@ -137,6 +142,15 @@ async def test_unicode_to_text_success(
         ),
         # Decode errors
         ("decode", "U+ABCX", "U+", " ", 16, status.HTTP_400_BAD_REQUEST, "Invalid code point value 'ABCX' for base 16"),
+        (
+            "decode",
+            "U+0048U+00GZ",
+            "U+",
+            "",
+            16,
+            status.HTTP_400_BAD_REQUEST,
+            "Invalid code point value '00GZ' for base 16",
+        ),
         ("decode", "102", "", " ", 2, status.HTTP_400_BAD_REQUEST, "Invalid code point value '102' for base 2"),
         (
             "decode",
@@ -193,3 +207,11 @@ async def test_unicode_converter_errors(
         assert output.result == ""
     else:
         pytest.fail(f"Unexpected status code {expected_status} or error condition")
+
+
+@pytest.mark.asyncio
+async def test_text_to_unicode_too_long(client: TestClient):
+    """Test that oversized text is rejected at validation time."""
+    response = client.post("/api/unicode-converter/encode", json={"text": "a" * 1_000_001})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "at most 1000000 characters" in str(response.json())
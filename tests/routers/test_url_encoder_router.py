@@ -38,6 +38,8 @@ PARTIALLY_ENCODED = "Hello%20World%21%20This%20has%20spaces%20%26%20special%20ch
         ("encode", "simple", "simple"),  # No special chars
         ("encode", "", None),  # Handled by error case
         ("encode", "http://example.com/?q=test value", "http%3A%2F%2Fexample.com%2F%3Fq%3Dtest%20value"),
+        ("encode", "héllo 中文 ~-._", "h%C3%A9llo%20%E4%B8%AD%E6%96%87%20~-._"),  # UTF-8 bytes, unreserved kept
+        ("encode", "100%", "100%25"),  # Existing percent signs are escaped too
         # Decoding
         ("decode", ENCODED_TEXT, PLAIN_TEXT),
         ("decode", PARTIALLY_ENCODED, PLAIN_TEXT),
@@ -93,3 +95,11 @@ async def test_url_encoder_errors(
         assert error_substring in str(response.json()).lower()
     else:
         assert error_substring in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_url_encoder_too_long(client: TestClient):
+    """Test that oversized text is rejected at validation time."""
+    response = client.post("/api/url-encoder/", json={"text": "a" * 1_000_001, "mode": "encode"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "at most 1000000 characters" in str(response.json())
@@ -3,6 +3,7 @@ from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 from models.url_parser_models import UrlParserInput, UrlParserOutput
+from routers.url_parser_router import _url_components_cached
 from routers.url_parser_router import router as url_parser_router
 
 
@@ -169,6 +170,19 @@ async def test_parse_url_success(client: TestClient, input_url: str, expected_co
         assert getattr(output, key) == value, f"Mismatch on component: {key}"
 
 
+def test_parse_url_repeated_url_hits_cache(client: TestClient):
+    """Repeated URLs should be served from the parse cache with identical output."""
+    _url_components_cached.cache_clear()
+    payload = UrlParserInput(url="https://example.com/search?q=a&q=b#top").model_dump()
+
+    first = client.post("/api/url-parser/", json=payload)
+    second = client.post("/api/url-parser/", json=payload)
+
+    assert first.json() == second.json()
+    assert first.json()["query_params"] == {"q": ["a", "b"]}
+    assert _url_components_cached.cache_info().hits == 1
+
+
 @pytest.mark.parametrize(
     "input_url, expected_status, error_substring",
     [
@@ -186,3 +200,11 @@ async def test_parse_url_errors(client: TestClient, input_url: str, expected_sta
 
     assert response.status_code == expected_status
     assert error_substring in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_parse_url_too_long(client: TestClient):
+    """Test that oversized URLs are rejected at validation time."""
+    response = client.post("/api/url-parser/", json={"url": "https://example.com/" + "a" * 65_536})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "at most 65536 characters" in str(response.json())
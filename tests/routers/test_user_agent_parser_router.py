@@ -3,6 +3,7 @@ from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 from models.user_agent_parser_models import UserAgentInput, UserAgentOutput
+from routers.user_agent_parser_router import _describe_user_agent_cached
 from routers.user_agent_parser_router import router as ua_parser_router
 
 
@@ -94,6 +95,18 @@ async def test_parse_user_agent_success(
     assert isinstance(device_data["model"], str)
 
 
+def test_parse_user_agent_repeated_string_hits_cache(client: TestClient):
+    """Repeated User-Agent strings should be served from the parse cache with identical output."""
+    _describe_user_agent_cached.cache_clear()
+    payload = UserAgentInput(user_agent=UA_CHROME_WINDOWS).model_dump()
+
+    first = client.post("/api/user-agent-parser/", json=payload)
+    second = client.post("/api/user-agent-parser/", json=payload)
+
+    assert first.json() == second.json()
+    assert _describe_user_agent_cached.cache_info().hits == 1
+
+
 @pytest.mark.parametrize(
     "input_ua, expected_status, error_substring",
     [
@@ -118,3 +131,11 @@ async def test_parse_user_agent_invalid_type(client: TestClient):
     response = client.post("/api/user-agent-parser/", json={"user_agent": 1234})
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     assert "input should be a valid string" in str(response.json()).lower()
+
+
+@pytest.mark.asyncio
+async def test_parse_user_agent_too_long(client: TestClient):
+    """Test that oversized User-Agent strings are rejected at validation time."""
+    response = client.post("/api/user-agent-parser/", json={"user_agent": "Mozilla/5.0 " + "a" * 8192})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "at most 8192 characters" in str(response.json())
@@ -4,6 +4,7 @@ import pytest
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
+from mcp_server.tools.uuid_generator import _namespace_uuid
 from models.uuid_models import UuidResponse
 from routers.uuid_router import router as uuid_router
 
@@ -95,3 +96,28 @@ async def test_generate_uuid_invalid_version(
         assert error_substring is not None
         # Add explicit check for detail in 400 errors
         assert error_substring.lower() in response.json()["detail"].lower()
+
+
+@pytest.mark.parametrize("version, generator", [(3, uuid.uuid3), (5, uuid.uuid5)])
+@pytest.mark.asyncio
+async def test_generate_name_based_uuid(client: TestClient, version: int, generator):
+    """Name-based UUIDs match the stdlib result; the parsed namespace is reused across requests."""
+    _namespace_uuid.cache_clear()
+    payload = {"namespace": str(uuid.NAMESPACE_DNS), "name": "example.com"}
+
+    first = client.post(f"/api/uuid/v{version}", json=payload)
+    second = client.post(f"/api/uuid/v{version}", json=payload)
+
+    assert first.status_code == status.HTTP_200_OK
+    assert first.json()["uuid"] == str(generator(uuid.NAMESPACE_DNS, "example.com"))
+    assert second.json() == first.json()
+    assert _namespace_uuid.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_name_based_uuid_invalid_namespace(client: TestClient):
+    """An unparseable namespace is rejected with 400."""
+    response = client.post("/api/uuid/v5", json={"namespace": "not-a-uuid", "name": "example.com"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Invalid namespace UUID: not-a-uuid" in response.json()["detail"]
@@ -1,10 +1,12 @@
 import xml.dom.minidom
+import xml.etree.ElementTree as ET
 
 import pytest
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 from models.xml_formatter_models import XmlInput, XmlOutput
+from routers import xml_formatter_router as xml_formatter_module
 from routers.xml_formatter_router import router as xml_formatter_router
 
 
@@ -22,6 +24,16 @@ def client(test_app: FastAPI) -> TestClient:
     return TestClient(test_app)
 
 
+# Re-indenting uses lxml when it is installed and ElementTree otherwise; run the tests against both
+@pytest.fixture(params=["lxml", "elementtree"])
+def xml_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "lxml" and xml_formatter_module.LET is None:
+        pytest.skip("lxml is not installed")
+    if request.param == "elementtree":
+        monkeypatch.setattr(xml_formatter_module, "LET", None)
+    return request.param
+
+
 # --- Test XML Formatting ---
 
 # Sample XML strings
@@ -70,6 +82,7 @@ PRETTY_XML_INDENT2_DECL = (
 @pytest.mark.asyncio
 async def test_format_xml(
     client: TestClient,
+    xml_backend: str,
     input_xml: str,
     indent: str,
     preserve_whitespace: bool,
@@ -123,6 +136,44 @@ async def test_format_xml(
             assert "<?xml" not in output.formatted
 
 
+@pytest.mark.asyncio
+async def test_format_xml_indent_matches_elementtree_parsing(client: TestClient, xml_backend: str):
+    """Re-indenting reads the document like ElementTree: text as given, comments and PIs dropped."""
+    payload = XmlInput(
+        xml='<?xml version="1.0" encoding="ISO-8859-1"?><a><!-- note --><?pi x?><b>héllo &amp; bye</b></a>',
+        preserve_whitespace=False,
+        omit_declaration=True,
+    )
+
+    response = client.post("/api/xml-formatter/", json=payload.model_dump())
+
+    assert response.status_code == status.HTTP_200_OK
+    output = XmlOutput(**response.json())
+    assert output.error is None
+    assert output.formatted == "<a>\n  <b>héllo &amp; bye</b>\n</a>"
+
+
+@pytest.mark.asyncio
+async def test_format_xml_indent_preserves_namespaced_tree(client: TestClient, xml_backend: str):
+    """Both backends keep the same element tree.
+
+    Serialization still differs: ElementTree renames namespace prefixes to ns0, ns1, ... and writes
+    empty elements as <b />, where lxml keeps the original prefixes and writes <b/>.
+    """
+    input_xml = '<p:a xmlns:p="urn:x"><p:b/><c k="v">text</c></p:a>'
+    payload = XmlInput(xml=input_xml, preserve_whitespace=False, omit_declaration=True)
+
+    response = client.post("/api/xml-formatter/", json=payload.model_dump())
+
+    assert response.status_code == status.HTTP_200_OK
+    output = XmlOutput(**response.json())
+    assert output.error is None
+    formatted, original = ET.fromstring(output.formatted), ET.fromstring(input_xml)
+    assert [(el.tag, el.attrib, (el.text or "").strip()) for el in formatted.iter()] == [
+        (el.tag, el.attrib, (el.text or "").strip()) for el in original.iter()
+    ]
+
+
 # Test invalid input types (Pydantic validation)
 @pytest.mark.asyncio
 async def test_format_xml_invalid_type(client: TestClient):
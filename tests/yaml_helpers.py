@@ -0,0 +1,10 @@
+"""YAML loader and dumper shared by the tests: libyaml's C classes when PyYAML was built with them."""
+
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
+__all__ = ["YamlDumper", "YamlLoader"]